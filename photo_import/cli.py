@@ -4,20 +4,28 @@ Command-line interface for photo import tool.
 
 import argparse
 import logging
+import os
+import shutil
 import sys
+import time
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 from . import __version__
-from .database import Database
-from .scanner import PhotoScanner
-from .copier import PhotoCopier
-from .models import BatchStatus, FileStatus
-from .video_database import VideoDatabase
-from .video_scanner import VideoScanner
-from .video_copier import VideoCopier
-from .video_models import VideoBatchStatus, VideoFileStatus
+
+# Emoji shown next to each batch status, keyed by status value so the same
+# read-only map serves both BatchStatus and VideoBatchStatus
+STATUS_EMOJI = MappingProxyType({
+    "scanning": "🔍",
+    "scanned": "📋",
+    "copying": "📤",
+    "completed": "✅",
+    "failed": "❌",
+    "paused": "⏸️",
+})
 
 
 def setup_logging(verbose: bool = False):
@@ -30,13 +38,19 @@ def setup_logging(verbose: bool = False):
     )
 
 
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+SIZE_DIVISORS = tuple(1 << (10 * i) for i in range(len(SIZE_UNITS)))
+
+
 def format_size(size_bytes: int) -> str:
     """Format bytes to human-readable size."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} PB"
+    if size_bytes <= 0:
+        return f"{size_bytes:.1f} B"
+
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    # (clamped to bytes for sizes below 1)
+    unit = min(max(0, (int(size_bytes).bit_length() - 1) // 10), len(SIZE_UNITS) - 1)
+    return f"{size_bytes / SIZE_DIVISORS[unit]:.1f} {SIZE_UNITS[unit]}"
 
 
 def format_duration(delta) -> str:
@@ -53,23 +67,134 @@ def format_duration(delta) -> str:
         return f"{seconds}s"
 
 
-def progress_bar(current: int, total: int, width: int = 40) -> str:
+# Default progress bar width
+PROGRESS_BAR_WIDTH = 40
+
+
+@lru_cache(maxsize=None)
+def _bar_fill(filled: int, width: int) -> str:
+    """Return the bar body for a fill level, built once per (filled, width)."""
+    return "=" * filled + "-" * (width - filled)
+
+
+def progress_bar(current: int, total: int, width: int = PROGRESS_BAR_WIDTH) -> str:
     """Generate a text progress bar."""
     if total == 0:
-        return "[" + "=" * width + "]"
+        return f"[{_bar_fill(width, width)}]"
 
     filled = int(width * current / total)
-    bar = "=" * filled + "-" * (width - filled)
+    bar = _bar_fill(filled, width)
     percent = 100 * current / total
     return f"[{bar}] {percent:.1f}% ({current}/{total})"
 
 
+class _ThrottledProgress:
+    """
+    Decides when a progress line is worth redrawing.
+
+    A redraw happens at most every min_interval seconds, except for the final
+    update (current == total), which is always drawn so the bar ends at 100%.
+    """
+
+    def __init__(self, min_interval: float = 0.1):
+        self.min_interval = min_interval
+        self.last_emit_ts = 0.0
+        self.last_line = ""
+
+    def should_emit(self, current: int, total: int) -> bool:
+        now = time.monotonic()
+        if now - self.last_emit_ts < self.min_interval and current < total:
+            return False
+        self.last_emit_ts = now
+        return True
+
+    def write(self, line: str):
+        """Write the line unless it is identical to the one already shown."""
+        if line == self.last_line:
+            return
+        self.last_line = line
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+
+# ANSI "erase to end of line", used instead of space padding on terminals
+ERASE_LINE_END = "\x1b[K"
+
+
+def _make_throttled_progress(
+    show_filename: bool = True,
+    min_interval: float = 0.1,
+    name_width: int = 30,
+):
+    """
+    Build a progress callback that redraws through a _ThrottledProgress.
+
+    The current file's basename is truncated to name_width characters. On a
+    terminal the whole line (bar, counters and name) is also clipped to the
+    terminal width and ended with an erase-to-end-of-line code; otherwise it is padded with spaces so a shorter
+    name fully overwrites the previous one.
+    """
+    throttle = _ThrottledProgress(min_interval)
+    pad_width = name_width + 5
+    is_tty = sys.stdout.isatty()
+
+    def progress_callback(current: int, total: int, current_file: str):
+        if not throttle.should_emit(current, total):
+            return
+
+        bar = progress_bar(current, total)
+        columns = None
+        if is_tty:
+            # Queried per redraw (at most every min_interval) to follow resizes;
+            # one column is left free so the line never wraps
+            columns = shutil.get_terminal_size().columns - 1
+
+        if not show_filename:
+            if is_tty:
+                throttle.write(f"\r{bar[:columns]}{ERASE_LINE_END}")
+            else:
+                throttle.write(f"\r{bar}")
+            return
+
+        filename = os.path.basename(current_file)
+        limit = name_width
+        if is_tty:
+            limit = min(limit, columns - len(bar) - 1)
+
+        # Truncate filename if too long
+        if len(filename) > limit:
+            filename = filename[:limit - 3] + "..." if limit > 3 else ""
+
+        if is_tty:
+            # The bar and counters alone may not fit on narrow terminals
+            line = f"{bar} {filename}"[:columns]
+            throttle.write(f"\r{line}{ERASE_LINE_END}")
+        else:
+            throttle.write(f"\r{bar} {filename.ljust(pad_width)}")
+
+    return progress_callback
+
+
 class CLI:
     """Command-line interface handler."""
 
     def __init__(self, db_path: str = "photo_import.db", video_db_path: str = "video_import.db"):
-        self.db = Database(db_path)
-        self.video_db = VideoDatabase(video_db_path)
+        self._db_path = db_path
+        self._video_db_path = video_db_path
+
+    @cached_property
+    def db(self):
+        """Photo database, opened on first use."""
+        from .database import Database
+
+        return Database(self._db_path)
+
+    @cached_property
+    def video_db(self):
+        """Video database, opened on first use."""
+        from .video_database import VideoDatabase
+
+        return VideoDatabase(self._video_db_path)
 
     def scan(
         self,
@@ -78,36 +203,43 @@ class CLI:
         no_checksum: bool = False,
         resume: bool = True,
         workers: Optional[int] = None,
+        use_exiftool: bool = False,
+        use_processes: bool = False,
+        defer_checksums: bool = False,
     ):
         """Scan source directory for photos."""
         source_path = Path(source).resolve()
         target_path = Path(target).resolve()
 
-        # Import here to get default workers count
-        from .scanner import DEFAULT_WORKERS
-        num_workers = workers or DEFAULT_WORKERS
+        # Import here so commands that don't scan skip loading the EXIF readers
+        from .scanner import DEFAULT_PROCESS_WORKERS, DEFAULT_WORKERS, PhotoScanner
+
+        if use_processes:
+            num_workers = workers or DEFAULT_PROCESS_WORKERS
+        else:
+            num_workers = workers or DEFAULT_WORKERS
 
         print(f"\n📸 Photo Import Tool v{__version__}")
         print("=" * 50)
         print(f"Source: {source_path}")
         print(f"Target: {target_path}")
-        print(f"Checksums: {'disabled' if no_checksum else 'enabled'}")
-        print(f"Workers: {num_workers} (parallel threads)")
+        if no_checksum:
+            print("Checksums: disabled")
+        else:
+            print(f"Checksums: {'same-size files only' if defer_checksums else 'enabled'}")
+        print(f"Workers: {num_workers} (parallel {'processes' if use_processes else 'threads'})")
         print("=" * 50)
 
-        def progress_callback(scanned: int, total: int, current_file: str):
-            bar = progress_bar(scanned, total)
-            filename = Path(current_file).name
-            # Truncate filename if too long
-            if len(filename) > 30:
-                filename = filename[:27] + "..."
-            print(f"\r{bar} {filename:<35}", end="", flush=True)
+        progress_callback = _make_throttled_progress()
 
         scanner = PhotoScanner(
             self.db,
             calculate_checksums=not no_checksum,
             progress_callback=progress_callback,
             num_workers=num_workers,
+            use_exiftool=use_exiftool,
+            use_processes=use_processes,
+            defer_checksums=defer_checksums,
         )
 
         try:
@@ -144,22 +276,25 @@ class CLI:
         dry_run: bool = False,
         skip_no_exif: bool = False,
         use_file_date: bool = True,
+        workers: int = 1,
     ):
         """Copy scanned photos to target directory."""
+        from .copier import PhotoCopier
+
         # Get batch
         if batch_id is None:
-            batch = self.db.get_latest_batch()
-            if not batch:
+            latest = self.db.get_latest_batch()
+            if not latest:
                 print("❌ No batches found. Run 'scan' first.")
                 sys.exit(1)
-            batch_id = batch.id
-        else:
-            batch = self.db.get_batch(batch_id)
-            if not batch:
-                print(f"❌ Batch {batch_id} not found.")
-                sys.exit(1)
+            batch_id = latest.id
 
-        stats = self.db.get_batch_stats(batch_id)
+        batch_with_stats = self.db.get_batch_with_stats(batch_id)
+        if not batch_with_stats:
+            print(f"❌ Batch {batch_id} not found.")
+            sys.exit(1)
+        batch, stats = batch_with_stats
+        pending = stats['pending'] or 0
 
         print(f"\n📸 Photo Import Tool v{__version__}")
         print("=" * 50)
@@ -167,27 +302,23 @@ class CLI:
         print(f"Status: {batch.status.value}")
         print(f"Source: {batch.source_directory}")
         print(f"Target: {batch.target_directory}")
-        print(f"Pending files: {stats['pending']}")
+        print(f"Pending files: {pending}")
         if dry_run:
             print("Mode: DRY RUN (no files will be copied)")
         print("=" * 50)
 
-        if stats['pending'] == 0:
+        if pending == 0:
             print("\n✅ No pending files to copy.")
             return
 
-        def progress_callback(copied: int, total: int, current_file: str):
-            bar = progress_bar(copied, total)
-            filename = Path(current_file).name
-            if len(filename) > 30:
-                filename = filename[:27] + "..."
-            print(f"\r{bar} {filename:<35}", end="", flush=True)
+        progress_callback = _make_throttled_progress()
 
         copier = PhotoCopier(
             self.db,
             use_file_date_fallback=use_file_date,
             skip_no_exif=skip_no_exif,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            max_workers=workers,
         )
 
         try:
@@ -220,82 +351,95 @@ class CLI:
 
     def status(self, batch_id: Optional[int] = None, show_failed: bool = False):
         """Show status of batches."""
-        if batch_id is not None:
-            batch = self.db.get_batch(batch_id)
-            if not batch:
-                print(f"❌ Batch {batch_id} not found.")
-                sys.exit(1)
-            batches = [batch]
-        else:
-            batches = self.db.list_batches(limit=10)
-
-        if not batches:
-            print("No batches found.")
-            return
-
-        print(f"\n📸 Photo Import Tool v{__version__}")
-        print("=" * 70)
-
-        for batch in batches:
-            stats = self.db.get_batch_stats(batch.id)
-
-            status_emoji = {
-                BatchStatus.SCANNING: "🔍",
-                BatchStatus.SCANNED: "📋",
-                BatchStatus.COPYING: "📤",
-                BatchStatus.COMPLETED: "✅",
-                BatchStatus.FAILED: "❌",
-                BatchStatus.PAUSED: "⏸️",
-            }.get(batch.status, "❓")
-
-            print(f"\nBatch #{batch.id} {status_emoji} {batch.status.value}")
-            print("-" * 60)
-            print(f"  Source:    {batch.source_directory}")
-            print(f"  Target:    {batch.target_directory}")
-            print(f"  Started:   {batch.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
-
-            if batch.scan_completed_at:
-                print(f"  Scanned:   {batch.scan_completed_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            if batch.copy_started_at:
-                print(f"  Copy began: {batch.copy_started_at.strftime('%Y-%m-%d %H:%M:%S')}")
-            if batch.completed_at:
-                print(f"  Completed: {batch.completed_at.strftime('%Y-%m-%d %H:%M:%S')}")
-
-            print(f"\n  Files:")
-            print(f"    Total:    {stats['total']}")
-            print(f"    Pending:  {stats['pending']}")
-            print(f"    Copied:   {stats['copied']}")
-            print(f"    Skipped:  {stats['skipped']}")
-            print(f"    Failed:   {stats['failed']}")
-            print(f"    With EXIF: {stats['with_exif']}")
-            print(f"    Size:     {format_size(stats['total_size'] or 0)}")
-
-            # Show failed files if requested
-            if show_failed and stats['failed'] > 0:
-                failed_files = self.db.get_files_by_status(batch.id, FileStatus.FAILED, limit=20)
-                print(f"\n  Failed files (showing up to 20):")
-                for f in failed_files:
-                    print(f"    - {f.filename}: {f.error_message}")
+        from .models import FileStatus
+
+        with self.db.read_transaction():
+            if batch_id is not None:
+                batch = self.db.get_batch(batch_id)
+                if not batch:
+                    print(f"❌ Batch {batch_id} not found.")
+                    sys.exit(1)
+                batches = [batch]
+            else:
+                batches = self.db.list_batches(limit=10)
+
+            if not batches:
+                print("No batches found.")
+                return
+
+            print(f"\n📸 Photo Import Tool v{__version__}")
+            print("=" * 70)
+
+            all_stats = self.db.get_batch_stats_many([b.id for b in batches])
+
+            all_failed = {}
+            if show_failed:
+                all_failed = self.db.get_files_by_status_many(
+                    [b.id for b in batches if all_stats[b.id]['failed']],
+                    FileStatus.FAILED,
+                    limit_per_batch=20,
+                )
+
+            for batch in batches:
+                stats = all_stats[batch.id]
+
+                status_emoji = STATUS_EMOJI.get(batch.status.value, "❓")
+
+                lines = [
+                    f"\nBatch #{batch.id} {status_emoji} {batch.status.value}",
+                    "-" * 60,
+                    f"  Source:    {batch.source_directory}",
+                    f"  Target:    {batch.target_directory}",
+                    f"  Started:   {batch.started_at.isoformat(' ', 'seconds')}",
+                ]
+
+                if batch.scan_completed_at:
+                    lines.append(f"  Scanned:   {batch.scan_completed_at.isoformat(' ', 'seconds')}")
+                if batch.copy_started_at:
+                    lines.append(f"  Copy began: {batch.copy_started_at.isoformat(' ', 'seconds')}")
+                if batch.completed_at:
+                    lines.append(f"  Completed: {batch.completed_at.isoformat(' ', 'seconds')}")
+
+                lines += [
+                    f"\n  Files:",
+                    f"    Total:    {stats['total']}",
+                    f"    Pending:  {stats['pending']}",
+                    f"    Copied:   {stats['copied']}",
+                    f"    Skipped:  {stats['skipped']}",
+                    f"    Failed:   {stats['failed']}",
+                    f"    With EXIF: {stats['with_exif']}",
+                    f"    Size:     {format_size(stats['total_size'] or 0)}",
+                ]
+
+                # Show failed files if requested
+                if show_failed and stats['failed'] > 0:
+                    lines.append(f"\n  Failed files (showing up to 20):")
+                    for f in all_failed[batch.id]:
+                        lines.append(f"    - {f.filename}: {f.error_message}")
+
+                # One write per batch instead of a print() per line
+                sys.stdout.write("\n".join(lines) + "\n")
 
         print("\n" + "=" * 70)
 
     def retry(self, batch_id: int):
         """Retry failed files in a batch."""
-        batch = self.db.get_batch(batch_id)
-        if not batch:
+        from .copier import PhotoCopier
+
+        batch_with_stats = self.db.get_batch_with_stats(batch_id)
+        if not batch_with_stats:
             print(f"❌ Batch {batch_id} not found.")
             sys.exit(1)
+        _, stats = batch_with_stats
 
-        stats = self.db.get_batch_stats(batch_id)
-        if stats['failed'] == 0:
+        failed = stats['failed'] or 0
+        if failed == 0:
             print("✅ No failed files to retry.")
             return
 
-        print(f"\nRetrying {stats['failed']} failed files...")
+        print(f"\nRetrying {failed} failed files...")
 
-        def progress_callback(copied: int, total: int, current_file: str):
-            bar = progress_bar(copied, total)
-            print(f"\r{bar}", end="", flush=True)
+        progress_callback = _make_throttled_progress(show_filename=False)
 
         copier = PhotoCopier(self.db, progress_callback=progress_callback)
 
@@ -326,34 +470,35 @@ class CLI:
         no_checksum: bool = True,  # Default off for videos (large files)
         resume: bool = True,
         workers: Optional[int] = None,
+        use_processes: bool = False,
     ):
         """Scan source directory for videos."""
         source_path = Path(source).resolve()
         target_path = Path(target).resolve()
 
-        from .video_scanner import DEFAULT_WORKERS
-        num_workers = workers or DEFAULT_WORKERS
+        from .video_scanner import DEFAULT_PROCESS_WORKERS, DEFAULT_WORKERS, VideoScanner
+
+        if use_processes:
+            num_workers = workers or DEFAULT_PROCESS_WORKERS
+        else:
+            num_workers = workers or DEFAULT_WORKERS
 
         print(f"\n🎬 Video Import Tool v{__version__}")
         print("=" * 50)
         print(f"Source: {source_path}")
         print(f"Target: {target_path}")
         print(f"Checksums: {'enabled' if not no_checksum else 'disabled (default for videos)'}")
-        print(f"Workers: {num_workers} (parallel threads)")
+        print(f"Workers: {num_workers} (parallel {'processes' if use_processes else 'threads'})")
         print("=" * 50)
 
-        def progress_callback(scanned: int, total: int, current_file: str):
-            bar = progress_bar(scanned, total)
-            filename = Path(current_file).name
-            if len(filename) > 30:
-                filename = filename[:27] + "..."
-            print(f"\r{bar} {filename:<35}", end="", flush=True)
+        progress_callback = _make_throttled_progress()
 
         scanner = VideoScanner(
             self.video_db,
             calculate_checksums=not no_checksum,
             progress_callback=progress_callback,
             num_workers=num_workers,
+            use_processes=use_processes,
         )
 
         try:
@@ -390,8 +535,11 @@ class CLI:
         dry_run: bool = False,
         skip_no_metadata: bool = False,
         use_file_date: bool = True,
+        workers: int = 1,
     ):
         """Copy scanned videos to target directory."""
+        from .video_copier import VideoCopier
+
         # Get batch
         if batch_id is None:
             batch = self.video_db.get_latest_batch()
@@ -422,18 +570,14 @@ class CLI:
             print("\n✅ No pending video files to copy.")
             return
 
-        def progress_callback(copied: int, total: int, current_file: str):
-            bar = progress_bar(copied, total)
-            filename = Path(current_file).name
-            if len(filename) > 30:
-                filename = filename[:27] + "..."
-            print(f"\r{bar} {filename:<35}", end="", flush=True)
+        progress_callback = _make_throttled_progress()
 
         copier = VideoCopier(
             self.video_db,
             use_file_date_fallback=use_file_date,
             skip_no_metadata=skip_no_metadata,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            max_workers=workers,
         )
 
         try:
@@ -466,6 +610,8 @@ class CLI:
 
     def video_status(self, batch_id: Optional[int] = None, show_failed: bool = False):
         """Show status of video batches."""
+        from .video_models import VideoFileStatus
+
         if batch_id is not None:
             batch = self.video_db.get_batch(batch_id)
             if not batch:
@@ -482,51 +628,55 @@ class CLI:
         print(f"\n🎬 Video Import Tool v{__version__}")
         print("=" * 70)
 
+        all_stats = self.video_db.get_batch_stats_many([b.id for b in batches])
+
         for batch in batches:
-            stats = self.video_db.get_batch_stats(batch.id)
+            stats = all_stats[batch.id]
 
-            status_emoji = {
-                VideoBatchStatus.SCANNING: "🔍",
-                VideoBatchStatus.SCANNED: "📋",
-                VideoBatchStatus.COPYING: "📤",
-                VideoBatchStatus.COMPLETED: "✅",
-                VideoBatchStatus.FAILED: "❌",
-                VideoBatchStatus.PAUSED: "⏸️",
-            }.get(batch.status, "❓")
-
-            print(f"\nVideo Batch #{batch.id} {status_emoji} {batch.status.value}")
-            print("-" * 60)
-            print(f"  Source:    {batch.source_directory}")
-            print(f"  Target:    {batch.target_directory}")
-            print(f"  Started:   {batch.started_at.strftime('%Y-%m-%d %H:%M:%S')}")
+            status_emoji = STATUS_EMOJI.get(batch.status.value, "❓")
+
+            lines = [
+                f"\nVideo Batch #{batch.id} {status_emoji} {batch.status.value}",
+                "-" * 60,
+                f"  Source:    {batch.source_directory}",
+                f"  Target:    {batch.target_directory}",
+                f"  Started:   {batch.started_at.isoformat(' ', 'seconds')}",
+            ]
 
             if batch.scan_completed_at:
-                print(f"  Scanned:   {batch.scan_completed_at.strftime('%Y-%m-%d %H:%M:%S')}")
+                lines.append(f"  Scanned:   {batch.scan_completed_at.isoformat(' ', 'seconds')}")
             if batch.copy_started_at:
-                print(f"  Copy began: {batch.copy_started_at.strftime('%Y-%m-%d %H:%M:%S')}")
+                lines.append(f"  Copy began: {batch.copy_started_at.isoformat(' ', 'seconds')}")
             if batch.completed_at:
-                print(f"  Completed: {batch.completed_at.strftime('%Y-%m-%d %H:%M:%S')}")
-
-            print(f"\n  Files:")
-            print(f"    Total:        {stats['total']}")
-            print(f"    Pending:      {stats['pending']}")
-            print(f"    Copied:       {stats['copied']}")
-            print(f"    Skipped:      {stats['skipped']}")
-            print(f"    Failed:       {stats['failed']}")
-            print(f"    With metadata: {stats['with_metadata']}")
-            print(f"    Size:         {format_size(stats['total_size'] or 0)}")
+                lines.append(f"  Completed: {batch.completed_at.isoformat(' ', 'seconds')}")
+
+            lines += [
+                f"\n  Files:",
+                f"    Total:        {stats['total']}",
+                f"    Pending:      {stats['pending']}",
+                f"    Copied:       {stats['copied']}",
+                f"    Skipped:      {stats['skipped']}",
+                f"    Failed:       {stats['failed']}",
+                f"    With metadata: {stats['with_metadata']}",
+                f"    Size:         {format_size(stats['total_size'] or 0)}",
+            ]
 
             # Show failed files if requested
             if show_failed and stats['failed'] > 0:
                 failed_files = self.video_db.get_files_by_status(batch.id, VideoFileStatus.FAILED, limit=20)
-                print(f"\n  Failed files (showing up to 20):")
+                lines.append(f"\n  Failed files (showing up to 20):")
                 for f in failed_files:
-                    print(f"    - {f.filename}: {f.error_message}")
+                    lines.append(f"    - {f.filename}: {f.error_message}")
+
+            # One write per batch instead of a print() per line
+            sys.stdout.write("\n".join(lines) + "\n")
 
         print("\n" + "=" * 70)
 
     def video_retry(self, batch_id: int):
         """Retry failed video files in a batch."""
+        from .video_copier import VideoCopier
+
         batch = self.video_db.get_batch(batch_id)
         if not batch:
             print(f"❌ Video batch {batch_id} not found.")
@@ -539,9 +689,7 @@ class CLI:
 
         print(f"\nRetrying {stats['failed']} failed video files...")
 
-        def progress_callback(copied: int, total: int, current_file: str):
-            bar = progress_bar(copied, total)
-            print(f"\r{bar}", end="", flush=True)
+        progress_callback = _make_throttled_progress(show_filename=False)
 
         copier = VideoCopier(self.video_db, progress_callback=progress_callback)
 
@@ -562,6 +710,47 @@ class CLI:
         self.video_status(batch_id=None)
 
 
+def _add_batch_arg(parser: argparse.ArgumentParser, help: str, required: bool = False):
+    """Add the --batch/-b option shared by most subcommands."""
+    parser.add_argument('--batch', '-b', type=int, required=required, help=help)
+
+
+def _add_dry_run_arg(
+    parser: argparse.ArgumentParser,
+    help: str = 'Simulate copy without actually copying files',
+):
+    """Add the --dry-run flag."""
+    parser.add_argument('--dry-run', action='store_true', help=help)
+
+
+def _add_scan_args(parser: argparse.ArgumentParser):
+    """Add the --no-resume and --workers options shared by scan commands."""
+    parser.add_argument(
+        '--no-resume', action='store_true',
+        help='Start fresh, do not resume existing scan'
+    )
+    parser.add_argument(
+        '--workers', '-w', type=int,
+        help='Number of parallel workers (default: auto, typically 4x CPU cores)'
+    )
+
+
+def _add_show_failed_arg(parser: argparse.ArgumentParser):
+    """Add the --show-failed flag used by status commands."""
+    parser.add_argument(
+        '--show-failed', action='store_true',
+        help='Show details of failed files'
+    )
+
+
+def _add_limit_arg(parser: argparse.ArgumentParser):
+    """Add the --limit option used by list commands."""
+    parser.add_argument(
+        '--limit', type=int, default=10,
+        help='Number of batches to show'
+    )
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -628,24 +817,33 @@ Examples:
         help='Skip MD5 checksum calculation (faster)'
     )
     scan_parser.add_argument(
-        '--no-resume', action='store_true',
-        help='Start fresh, do not resume existing scan'
+        '--checksum-duplicates', action='store_true',
+        help='Only checksum files whose size matches another file (faster)'
     )
     scan_parser.add_argument(
-        '--workers', '-w', type=int,
-        help='Number of parallel workers (default: auto, typically 4x CPU cores)'
+        '--exiftool', action='store_true',
+        help='Read EXIF dates in bulk with exiftool (must be installed)'
     )
+    scan_parser.add_argument(
+        '--processes', action='store_true',
+        help='Use worker processes instead of threads (faster for CPU-bound scans)'
+    )
+    _add_scan_args(scan_parser)
+    scan_parser.set_defaults(func=lambda cli, a: cli.scan(
+        a.source,
+        a.target,
+        no_checksum=a.no_checksum,
+        resume=not a.no_resume,
+        workers=a.workers,
+        use_exiftool=a.exiftool,
+        use_processes=a.processes,
+        defer_checksums=a.checksum_duplicates,
+    ))
 
     # Copy command
     copy_parser = subparsers.add_parser('copy', help='Copy scanned photos to target')
-    copy_parser.add_argument(
-        '--batch', '-b', type=int,
-        help='Batch ID to copy (default: latest)'
-    )
-    copy_parser.add_argument(
-        '--dry-run', action='store_true',
-        help='Simulate copy without actually copying files'
-    )
+    _add_batch_arg(copy_parser, 'Batch ID to copy (default: latest)')
+    _add_dry_run_arg(copy_parser)
     copy_parser.add_argument(
         '--skip-no-exif', action='store_true',
         help='Skip files without EXIF date'
@@ -654,31 +852,35 @@ Examples:
         '--no-file-date', action='store_true',
         help='Do not use file date as fallback when EXIF is missing'
     )
+    copy_parser.add_argument(
+        '--workers', '-w', type=int, default=1,
+        help='Number of parallel copy threads (default: 1)'
+    )
+    copy_parser.set_defaults(func=lambda cli, a: cli.copy(
+        batch_id=a.batch,
+        dry_run=a.dry_run,
+        skip_no_exif=a.skip_no_exif,
+        use_file_date=not a.no_file_date,
+        workers=a.workers,
+    ))
 
     # Status command
     status_parser = subparsers.add_parser('status', help='Show batch status')
-    status_parser.add_argument(
-        '--batch', '-b', type=int,
-        help='Show specific batch (default: all recent)'
-    )
-    status_parser.add_argument(
-        '--show-failed', action='store_true',
-        help='Show details of failed files'
-    )
+    _add_batch_arg(status_parser, 'Show specific batch (default: all recent)')
+    _add_show_failed_arg(status_parser)
+    status_parser.set_defaults(func=lambda cli, a: cli.status(
+        batch_id=a.batch, show_failed=a.show_failed
+    ))
 
     # Retry command
     retry_parser = subparsers.add_parser('retry', help='Retry failed files')
-    retry_parser.add_argument(
-        '--batch', '-b', type=int, required=True,
-        help='Batch ID to retry'
-    )
+    _add_batch_arg(retry_parser, 'Batch ID to retry', required=True)
+    retry_parser.set_defaults(func=lambda cli, a: cli.retry(a.batch))
 
     # List command
     list_parser = subparsers.add_parser('list', help='List all batches')
-    list_parser.add_argument(
-        '--limit', type=int, default=10,
-        help='Number of batches to show'
-    )
+    _add_limit_arg(list_parser)
+    list_parser.set_defaults(func=lambda cli, a: cli.list_batches(a.limit))
 
     # Expand command
     expand_parser = subparsers.add_parser(
@@ -690,14 +892,17 @@ Examples:
         '--target', '-t',
         help='Target directory (default: same as source, in-place expansion)'
     )
-    expand_parser.add_argument(
-        '--dry-run', action='store_true',
-        help='Simulate expansion without making changes'
-    )
+    _add_dry_run_arg(expand_parser, 'Simulate expansion without making changes')
     expand_parser.add_argument(
         '--move', action='store_true',
         help='Move files instead of copying (only when target differs from source)'
     )
+    expand_parser.set_defaults(func=lambda cli, a: expand_directories_cmd(
+        a.source,
+        a.target,
+        dry_run=a.dry_run,
+        move_files=a.move,
+    ))
 
     # Serve command
     serve_parser = subparsers.add_parser('serve', help='Start web browser for photo navigation')
@@ -714,6 +919,12 @@ Examples:
         '--no-browser', action='store_true',
         help='Do not open browser automatically'
     )
+    serve_parser.set_defaults(func=lambda cli, a: serve_photos_cmd(
+        a.directory,
+        port=a.port,
+        host=a.host,
+        open_browser=not a.no_browser,
+    ))
 
     # ===========================================
     # Video commands
@@ -728,24 +939,23 @@ Examples:
         help='Calculate MD5 checksums (slow for videos, off by default)'
     )
     video_scan_parser.add_argument(
-        '--no-resume', action='store_true',
-        help='Start fresh, do not resume existing scan'
-    )
-    video_scan_parser.add_argument(
-        '--workers', '-w', type=int,
-        help='Number of parallel workers (default: auto, typically 4x CPU cores)'
+        '--processes', action='store_true',
+        help='Use worker processes instead of threads (faster with --checksum)'
     )
+    _add_scan_args(video_scan_parser)
+    video_scan_parser.set_defaults(func=lambda cli, a: cli.video_scan(
+        a.source,
+        a.target,
+        no_checksum=not a.checksum,
+        resume=not a.no_resume,
+        workers=a.workers,
+        use_processes=a.processes,
+    ))
 
     # Video copy command
     video_copy_parser = subparsers.add_parser('video-copy', help='Copy scanned videos to target')
-    video_copy_parser.add_argument(
-        '--batch', '-b', type=int,
-        help='Batch ID to copy (default: latest)'
-    )
-    video_copy_parser.add_argument(
-        '--dry-run', action='store_true',
-        help='Simulate copy without actually copying files'
-    )
+    _add_batch_arg(video_copy_parser, 'Batch ID to copy (default: latest)')
+    _add_dry_run_arg(video_copy_parser)
     video_copy_parser.add_argument(
         '--skip-no-metadata', action='store_true',
         help='Skip files without metadata date'
@@ -754,31 +964,35 @@ Examples:
         '--no-file-date', action='store_true',
         help='Do not use file date as fallback when metadata is missing'
     )
+    video_copy_parser.add_argument(
+        '--workers', '-w', type=int, default=1,
+        help='Number of parallel copy threads (default: 1)'
+    )
+    video_copy_parser.set_defaults(func=lambda cli, a: cli.video_copy(
+        batch_id=a.batch,
+        dry_run=a.dry_run,
+        skip_no_metadata=a.skip_no_metadata,
+        use_file_date=not a.no_file_date,
+        workers=a.workers,
+    ))
 
     # Video status command
     video_status_parser = subparsers.add_parser('video-status', help='Show video batch status')
-    video_status_parser.add_argument(
-        '--batch', '-b', type=int,
-        help='Show specific batch (default: all recent)'
-    )
-    video_status_parser.add_argument(
-        '--show-failed', action='store_true',
-        help='Show details of failed files'
-    )
+    _add_batch_arg(video_status_parser, 'Show specific batch (default: all recent)')
+    _add_show_failed_arg(video_status_parser)
+    video_status_parser.set_defaults(func=lambda cli, a: cli.video_status(
+        batch_id=a.batch, show_failed=a.show_failed
+    ))
 
     # Video retry command
     video_retry_parser = subparsers.add_parser('video-retry', help='Retry failed video files')
-    video_retry_parser.add_argument(
-        '--batch', '-b', type=int, required=True,
-        help='Batch ID to retry'
-    )
+    _add_batch_arg(video_retry_parser, 'Batch ID to retry', required=True)
+    video_retry_parser.set_defaults(func=lambda cli, a: cli.video_retry(a.batch))
 
     # Video list command
     video_list_parser = subparsers.add_parser('video-list', help='List all video batches')
-    video_list_parser.add_argument(
-        '--limit', type=int, default=10,
-        help='Number of batches to show'
-    )
+    _add_limit_arg(video_list_parser)
+    video_list_parser.set_defaults(func=lambda cli, a: cli.video_list_batches(a.limit))
 
     args = parser.parse_args()
 
@@ -789,63 +1003,8 @@ Examples:
     setup_logging(args.verbose)
     cli = CLI(args.db, args.video_db)
 
-    if args.command == 'scan':
-        cli.scan(
-            args.source,
-            args.target,
-            no_checksum=args.no_checksum,
-            resume=not args.no_resume,
-            workers=args.workers,
-        )
-    elif args.command == 'copy':
-        cli.copy(
-            batch_id=args.batch,
-            dry_run=args.dry_run,
-            skip_no_exif=args.skip_no_exif,
-            use_file_date=not args.no_file_date,
-        )
-    elif args.command == 'status':
-        cli.status(batch_id=args.batch, show_failed=args.show_failed)
-    elif args.command == 'retry':
-        cli.retry(args.batch)
-    elif args.command == 'list':
-        cli.list_batches(args.limit)
-    elif args.command == 'expand':
-        expand_directories_cmd(
-            args.source,
-            args.target,
-            dry_run=args.dry_run,
-            move_files=args.move,
-        )
-    elif args.command == 'serve':
-        serve_photos_cmd(
-            args.directory,
-            port=args.port,
-            host=args.host,
-            open_browser=not args.no_browser,
-        )
-    # Video commands
-    elif args.command == 'video-scan':
-        cli.video_scan(
-            args.source,
-            args.target,
-            no_checksum=not args.checksum,
-            resume=not args.no_resume,
-            workers=args.workers,
-        )
-    elif args.command == 'video-copy':
-        cli.video_copy(
-            batch_id=args.batch,
-            dry_run=args.dry_run,
-            skip_no_metadata=args.skip_no_metadata,
-            use_file_date=not args.no_file_date,
-        )
-    elif args.command == 'video-status':
-        cli.video_status(batch_id=args.batch, show_failed=args.show_failed)
-    elif args.command == 'video-retry':
-        cli.video_retry(args.batch)
-    elif args.command == 'video-list':
-        cli.video_list_batches(args.limit)
+    # Each subparser binds its handler via set_defaults(func=...)
+    args.func(cli, args)
 
 
 def expand_directories_cmd(
@@ -871,11 +1030,7 @@ def expand_directories_cmd(
         print("Operation: IN-PLACE REORGANIZATION")
     print("=" * 50)
 
-    def progress_callback(processed: int, total: int, current_dir: str):
-        bar = progress_bar(processed, total)
-        if len(current_dir) > 25:
-            current_dir = current_dir[:22] + "..."
-        print(f"\r{bar} {current_dir:<30}", end="", flush=True)
+    progress_callback = _make_throttled_progress(name_width=25)
 
     try:
         result = expand_directories(
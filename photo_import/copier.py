@@ -2,21 +2,93 @@
 Photo copier module - copies photos to date-based directory structure.
 """
 
+import errno
 import logging
+import os
 import re
 import shutil
+import stat
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
 from .database import Database
 from .models import BatchStatus, PhotoFile, FileStatus
+from .scanner import calculate_checksum
 
 logger = logging.getLogger(__name__)
 
 # Number of files to process per commit
 COMMIT_BATCH_SIZE = 50
 
+# Copies queued per worker thread, bounds memory use on large batches
+COPY_QUEUE_FACTOR = 4
+
+# Bytes requested per in-kernel copy call
+KERNEL_COPY_CHUNK_SIZE = 1 << 30  # 1GB, larger requests are clamped anyway
+
+# Errors meaning the kernel copy call is not usable for this pair of files
+KERNEL_COPY_FALLBACK_ERRNOS = frozenset(
+    getattr(errno, name) for name in ('EXDEV', 'ENOSYS', 'EINVAL', 'EOPNOTSUPP', 'ENOTSUP')
+    if hasattr(errno, name)
+)
+
+# Errors meaning extended attributes are unsupported or not permitted
+XATTR_IGNORED_ERRNOS = frozenset(
+    getattr(errno, name) for name in ('EPERM', 'EACCES', 'ENOTSUP', 'ENODATA', 'EINVAL')
+    if hasattr(errno, name)
+)
+
+# Linux ioctl that shares a file's blocks with another (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+# Buffer for the user-space copy fallback (shutil's default is 64KB)
+USERSPACE_COPY_BUFFER_SIZE = 1 << 20  # 1MB
+
+# Allowed mtime difference when matching an existing copy (FAT/exFAT
+# targets store modification times with 2 second resolution)
+MTIME_MATCH_WINDOW = 2.0
+
+# Default file systems on macOS and Windows ignore case in file names
+CASE_INSENSITIVE_FS = sys.platform in ('darwin', 'win32')
+
+# Outcome of copying one file: (status, target_path, error_message)
+CopyResult = Tuple[FileStatus, Optional[str], Optional[str]]
+
+
+def _source_exists(listings: Dict[str, Optional[FrozenSet[str]]], source_path: str) -> bool:
+    """
+    Check a source file still exists, listing each directory once.
+
+    listings caches directory contents for the run. A directory that cannot
+    be listed (no read permission, I/O error on a network share) is cached
+    as None and its files are checked one by one instead.
+    """
+    dirname, filename = os.path.split(source_path)
+    if dirname in listings:
+        names = listings[dirname]
+    else:
+        try:
+            names = frozenset(os.listdir(dirname))
+        except OSError as e:
+            logger.debug(f"Cannot list {dirname}, checking files individually: {e}")
+            names = None
+        listings[dirname] = names
+
+    if names is None:
+        return os.path.exists(source_path)
+    return filename in names
+
+
+@lru_cache(maxsize=4096)
+def _date_folder(year: int, month: int, day: int) -> str:
+    """Format a date as a YYYY_MM_DD folder name."""
+    return f"{year:04d}_{month:02d}_{day:02d}"
+
 
 def generate_target_path(
     target_base: Path,
@@ -41,21 +113,31 @@ def generate_target_path(
     Returns:
         Target path (always returns a valid path using file date as fallback)
     """
-    # Prefer EXIF date
-    date = photo.exif_date
+    return Path(_target_path(str(target_base), photo, use_file_date_fallback))
 
-    # Fall back to file creation date, then modification date
-    if date is None and use_file_date_fallback:
-        # Prefer file creation date over modification date
-        date = photo.file_creation_date or photo.file_modification_date
 
-    # Final fallback - should never happen but be safe
+def _target_path(
+    target_base: str,
+    photo: PhotoFile,
+    use_file_date_fallback: bool,
+) -> str:
+    """String version of generate_target_path used on the copy hot path."""
+    # Prefer EXIF date; the common case takes no further branches
+    date = photo.exif_date
+
     if date is None:
-        date = photo.file_modification_date or datetime.now()
+        # Fall back to file creation date, then modification date
+        if use_file_date_fallback:
+            # Prefer file creation date over modification date
+            date = photo.file_creation_date or photo.file_modification_date
+
+        # Final fallback - should never happen but be safe
+        if date is None:
+            date = photo.file_modification_date or datetime.now()
 
     # Format: YYYY_MM_DD
-    date_folder = date.strftime("%Y_%m_%d")
-    return target_base / date_folder / photo.filename
+    date_folder = _date_folder(date.year, date.month, date.day)
+    return os.path.join(target_base, date_folder, photo.filename)
 
 
 def resolve_filename_conflict(target_path: Path) -> Path:
@@ -87,6 +169,116 @@ def resolve_filename_conflict(target_path: Path) -> Path:
         counter += 1
 
 
+def _name_key(name: str) -> str:
+    """Key used to compare file names, folding case where the OS ignores it."""
+    if CASE_INSENSITIVE_FS:
+        return name.casefold()
+    return name
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    """Clone src into dst without copying data, if the file system can."""
+    try:
+        import fcntl
+        fcntl.ioctl(dst_fd, FICLONE, src_fd)
+        return True
+    except (ImportError, OSError):
+        return False
+
+
+def _kernel_copy(src_fd: int, dst_fd: int) -> int:
+    """
+    Copy data between file descriptors without passing through user space.
+
+    Tries os.copy_file_range first (may reflink on the same filesystem),
+    then os.sendfile. Returns the number of bytes copied before giving up,
+    the caller finishes the rest; raises OSError only for real I/O errors.
+    """
+    copied = 0
+
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while True:
+                n = os.copy_file_range(src_fd, dst_fd, KERNEL_COPY_CHUNK_SIZE)
+                if n == 0:
+                    return copied
+                copied += n
+        except OSError as e:
+            if e.errno not in KERNEL_COPY_FALLBACK_ERRNOS:
+                raise
+
+    if hasattr(os, 'sendfile'):
+        try:
+            while True:
+                n = os.sendfile(dst_fd, src_fd, copied, KERNEL_COPY_CHUNK_SIZE)
+                if n == 0:
+                    return copied
+                copied += n
+        except OSError as e:
+            if e.errno not in KERNEL_COPY_FALLBACK_ERRNOS:
+                raise
+
+    return copied
+
+
+def _copy_xattrs(src_fd: int, dst_fd: int):
+    """Copy extended attributes between open files, as shutil.copystat does."""
+    try:
+        names = os.listxattr(src_fd)
+    except OSError as e:
+        if e.errno not in XATTR_IGNORED_ERRNOS:
+            raise
+        return
+
+    for name in names:
+        try:
+            os.setxattr(dst_fd, name, os.getxattr(src_fd, name))
+        except OSError as e:
+            if e.errno not in XATTR_IGNORED_ERRNOS:
+                raise
+
+
+def fast_copy(src: str | Path, dst: str | Path):
+    """
+    Copy a file with its metadata, like shutil.copy2.
+
+    On Linux the file is reflinked where the file system supports it,
+    otherwise the data is copied in the kernel (copy_file_range, then
+    sendfile); elsewhere shutil.copy2 is used, which already picks the
+    platform's native copy call where CPython supports one.
+
+    On Linux everything after opening works on the two file descriptors:
+    one fstat of the source supplies size, mode and times, so metadata is
+    copied without the extra path lookups of shutil.copystat.
+    """
+    if not hasattr(os, 'copy_file_range'):
+        shutil.copy2(src, dst)
+        return
+
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        src_stat = os.fstat(src_fd)
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        try:
+            if not _reflink(src_fd, dst_fd):
+                copied = _kernel_copy(src_fd, dst_fd)
+                if copied < src_stat.st_size:
+                    # Whatever the kernel could not copy is finished in user space
+                    with open(src_fd, 'rb', closefd=False) as fsrc, \
+                            open(dst_fd, 'wb', closefd=False) as fdst:
+                        fsrc.seek(copied)
+                        fdst.seek(copied)
+                        shutil.copyfileobj(fsrc, fdst, USERSPACE_COPY_BUFFER_SIZE)
+
+            _copy_xattrs(src_fd, dst_fd)
+            os.chmod(dst_fd, stat.S_IMODE(src_stat.st_mode))
+            os.utime(dst_fd, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+
+
 class PhotoCopier:
     """Copies photos to organized directory structure."""
 
@@ -96,6 +288,7 @@ class PhotoCopier:
         use_file_date_fallback: bool = True,
         skip_no_exif: bool = False,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        max_workers: int = 1,
     ):
         """
         Initialize the copier.
@@ -105,11 +298,36 @@ class PhotoCopier:
             use_file_date_fallback: Use file date when EXIF not available
             skip_no_exif: Skip files without EXIF date
             progress_callback: Optional callback(copied, total, current_file)
+            max_workers: Number of parallel copy threads (default: 1)
         """
         self.db = db
         self.use_file_date_fallback = use_file_date_fallback
         self.skip_no_exif = skip_no_exif
         self.progress_callback = progress_callback
+        self.max_workers = max(1, max_workers)
+
+        # Status updates not yet written to the database
+        self._pending_status: List[Tuple[int, FileStatus, Optional[str], Optional[str]]] = []
+        # Copies finished after an interrupt, never yielded by _run_copies
+        self._unreported: List[Tuple[PhotoFile, CopyResult]] = []
+
+        # Names taken in each target directory, on disk or claimed by a copy
+        # that may still be in flight
+        self._dir_cache: Dict[str, Set[str]] = {}
+        self._claimed_paths: Set[str] = set()
+        self._claim_lock = threading.Lock()
+
+        # Existing files for each target name, and their checksums, looked
+        # up once per run when checking for copies left by an earlier run
+        self._existing_copies: Dict[str, Dict[int, List[Tuple[str, float]]]] = {}
+        self._target_checksums: Dict[str, Optional[str]] = {}
+
+        # Target directories already created during this run
+        self._created_dirs: Set[str] = set()
+
+        # Names in each source directory, listed once per run (None if the
+        # directory could not be listed)
+        self._source_listings: Dict[str, Optional[FrozenSet[str]]] = {}
 
     def copy(self, batch_id: int, dry_run: bool = False) -> dict:
         """
@@ -131,11 +349,14 @@ class PhotoCopier:
                 f"Batch {batch_id} is in status {batch.status}, cannot copy"
             )
 
-        target_base = Path(batch.target_directory)
+        target_base = batch.target_directory
 
         # Update batch status to copying
         self.db.update_batch_status(batch_id, BatchStatus.COPYING)
 
+        self._unreported.clear()
+        results = None
+
         stats = {
             'total': 0,
             'copied': 0,
@@ -145,28 +366,26 @@ class PhotoCopier:
         }
 
         try:
-            # Process pending files
-            pending_files = self.db.get_pending_files(batch_id)
-            stats['total'] = len(pending_files)
+            # Process pending files, streamed from the database
+            pending_files = self.db.iter_pending_files(batch_id)
+            stats['total'] = self.db.count_files_by_status(batch_id, FileStatus.PENDING)
 
             logger.info(f"Starting copy of {stats['total']} files")
 
-            for i, photo in enumerate(pending_files):
-                try:
-                    result = self._copy_file(photo, target_base, dry_run)
-
-                    if result == 'copied':
-                        stats['copied'] += 1
-                    elif result == 'skipped':
-                        stats['skipped'] += 1
-                    else:
-                        stats['failed'] += 1
-
-                except Exception as e:
-                    logger.error(f"Error processing {photo.source_path}: {e}")
-                    self.db.update_file_status(
-                        photo.id, FileStatus.FAILED, error_message=str(e)
-                    )
+            # Copies may run in worker threads, status updates are
+            # recorded here on the calling thread only
+            results = self._run_copies(pending_files, target_base, dry_run)
+            for i, (photo, result) in enumerate(results):
+                status, target_path, error_message = result
+                self._pending_status.append(
+                    (photo.id, status, target_path, error_message)
+                )
+
+                if status == FileStatus.COPIED:
+                    stats['copied'] += 1
+                elif status == FileStatus.SKIPPED:
+                    stats['skipped'] += 1
+                else:
                     stats['failed'] += 1
 
                 # Progress callback
@@ -175,28 +394,33 @@ class PhotoCopier:
                         i + 1, stats['total'], photo.source_path
                     )
 
-                # Periodic batch count update
+                # Periodic status and batch count update
                 if (i + 1) % COMMIT_BATCH_SIZE == 0:
-                    self.db.update_batch_counts(batch_id)
+                    self._flush_status(batch_id)
 
-            # Final update
+            # Final update, recounting to correct any drift
+            self._flush_status(batch_id)
             self.db.update_batch_counts(batch_id)
 
             # Mark batch as complete if no pending files remain
-            remaining = self.db.get_pending_files(batch_id, limit=1)
+            remaining = self.db.count_files_by_status(batch_id, FileStatus.PENDING)
             if not remaining:
                 self.db.update_batch_status(batch_id, BatchStatus.COMPLETED)
                 logger.info("Batch completed successfully")
             else:
-                logger.info(f"{len(remaining)} files still pending")
+                logger.info(f"{remaining} files still pending")
 
         except KeyboardInterrupt:
             logger.info("Copy interrupted by user")
+            self._record_unreported(results)
+            self._flush_status(batch_id)
             self.db.update_batch_status(batch_id, BatchStatus.PAUSED)
             raise
 
         except Exception as e:
             logger.error(f"Copy failed: {e}")
+            self._record_unreported(results)
+            self._flush_status(batch_id)
             self.db.update_batch_status(batch_id, BatchStatus.PAUSED)
             raise
 
@@ -205,71 +429,282 @@ class PhotoCopier:
 
         return stats
 
+    def _record_unreported(self, results: Optional[Iterator]):
+        """Stop the copy pool and buffer the results it never yielded."""
+        if results is not None:
+            results.close()
+        for photo, (status, target_path, error_message) in self._unreported:
+            self._pending_status.append((photo.id, status, target_path, error_message))
+        self._unreported.clear()
+
+    def _flush_status(self, batch_id: int):
+        """Write buffered file status updates and the batch's new counts."""
+        if not self._pending_status:
+            return
+
+        statuses = [update[1] for update in self._pending_status]
+        with self.db.transaction():
+            self.db.update_file_status_bulk(self._pending_status)
+            self.db.increment_batch_counts(
+                batch_id,
+                copied=statuses.count(FileStatus.COPIED),
+                failed=statuses.count(FileStatus.FAILED),
+                skipped=statuses.count(FileStatus.SKIPPED),
+            )
+        self._pending_status.clear()
+
+    def _run_copies(
+        self,
+        photos: Iterable[PhotoFile],
+        target_base: str,
+        dry_run: bool,
+    ) -> Iterator[Tuple[PhotoFile, CopyResult]]:
+        """
+        Copy files, yielding (photo, result) pairs as copies finish.
+
+        With max_workers > 1 copies run in a thread pool and results are
+        yielded in completion order; at most max_workers * COPY_QUEUE_FACTOR
+        copies are queued at any time.
+        """
+        self._dir_cache.clear()
+        self._claimed_paths.clear()
+        self._existing_copies.clear()
+        self._target_checksums.clear()
+        self._created_dirs.clear()
+        self._source_listings.clear()
+
+        if self.max_workers == 1:
+            for photo in photos:
+                yield photo, self._safe_copy_file(photo, target_base, dry_run)
+            return
+
+        max_queued = self.max_workers * COPY_QUEUE_FACTOR
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        in_flight = {}
+        try:
+            for photo in photos:
+                future = executor.submit(
+                    self._safe_copy_file, photo, target_base, dry_run
+                )
+                in_flight[future] = photo
+
+                if len(in_flight) >= max_queued:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield in_flight.pop(future), future.result()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield in_flight.pop(future), future.result()
+        finally:
+            # Don't start queued copies after an interrupt or error
+            executor.shutdown(wait=True, cancel_futures=True)
+            # Copies already running have finished on disk; keep their
+            # results so they are recorded instead of left pending
+            for future, photo in in_flight.items():
+                if not future.cancelled():
+                    self._unreported.append((photo, future.result()))
+
+    def _safe_copy_file(
+        self,
+        photo: PhotoFile,
+        target_base: str,
+        dry_run: bool,
+    ) -> CopyResult:
+        """Copy a single file, turning unexpected errors into a failed result."""
+        try:
+            return self._copy_file(photo, target_base, dry_run)
+        except Exception as e:
+            logger.error(f"Error processing {photo.source_path}: {e}")
+            return FileStatus.FAILED, None, str(e)
+
+    def _target_names(self, parent: str) -> Set[str]:
+        """
+        Names taken in a target directory, on disk or claimed this run.
+
+        The directory is listed once; call with _claim_lock held.
+        """
+        names = self._dir_cache.get(parent)
+        if names is None:
+            try:
+                names = {_name_key(name) for name in os.listdir(parent)}
+            except FileNotFoundError:
+                names = set()
+            self._dir_cache[parent] = names
+        return names
+
+    def _claim_target(self, target_path: str) -> str:
+        """
+        Resolve filename conflicts for target_path and reserve the result.
+
+        Same naming as resolve_filename_conflict, but each target directory
+        is listed once and later lookups are set membership tests.
+        """
+        parent, name = os.path.split(target_path)
+
+        with self._claim_lock:
+            names = self._target_names(parent)
+
+            new_name = name
+            if _name_key(new_name) in names:
+                stem, suffix = os.path.splitext(name)
+                counter = 1
+                while _name_key(f"{stem}_{counter}{suffix}") in names:
+                    counter += 1
+                new_name = f"{stem}_{counter}{suffix}"
+                if counter > 100:
+                    logger.info(f"High conflict count ({counter}): {name} -> {new_name}")
+
+            names.add(_name_key(new_name))
+            target_path = os.path.join(parent, new_name)
+            self._claimed_paths.add(_name_key(target_path))
+
+        return target_path
+
+    def _existing_variants(self, target_path: str) -> Dict[int, List[Tuple[str, float]]]:
+        """
+        Files already on disk at target_path or one of its numbered variants
+        (photo_1.jpg, photo_2.jpg, ...), as {size: [(path, mtime)]}.
+
+        Each (directory, name) is walked once per run; call with _claim_lock
+        held.
+        """
+        key = _name_key(target_path)
+        variants = self._existing_copies.get(key)
+        if variants is None:
+            parent, name = os.path.split(target_path)
+            stem, suffix = os.path.splitext(name)
+            names = self._target_names(parent)
+
+            variants = {}
+            counter = 0
+            candidate = name
+            while _name_key(candidate) in names:
+                candidate_path = os.path.join(parent, candidate)
+                # Paths claimed by this run are new copies, never old ones
+                if _name_key(candidate_path) not in self._claimed_paths:
+                    try:
+                        st = os.stat(candidate_path)
+                    except OSError:
+                        pass
+                    else:
+                        variants.setdefault(st.st_size, []).append(
+                            (candidate_path, st.st_mtime)
+                        )
+                counter += 1
+                candidate = f"{stem}_{counter}{suffix}"
+
+            self._existing_copies[key] = variants
+        return variants
+
+    def _target_checksum(self, path: str) -> Optional[str]:
+        """Checksum of an existing target file, hashed at most once per run."""
+        if path not in self._target_checksums:
+            try:
+                self._target_checksums[path] = calculate_checksum(path)
+            except OSError:
+                self._target_checksums[path] = None
+        return self._target_checksums[path]
+
+    def _find_existing_copy(
+        self,
+        photo: PhotoFile,
+        target_path: str,
+    ) -> Optional[str]:
+        """
+        Find a copy of this photo already present at target_path or one of
+        its numbered variants.
+
+        Catches files copied by an earlier run that was interrupted before
+        their status was saved. Only photos with a recorded checksum can
+        match: the size and mtime must agree and the file's MD5 must equal
+        the checksum. A matched file is claimed, so it stands for one photo
+        only, and paths claimed by this run never match.
+        """
+        if not photo.checksum:
+            return None
+
+        with self._claim_lock:
+            candidates = list(
+                self._existing_variants(target_path).get(photo.file_size, ())
+            )
+
+        modified = photo.file_modification_date.timestamp()
+        for candidate_path, mtime in candidates:
+            if abs(mtime - modified) > MTIME_MATCH_WINDOW:
+                continue
+            if self._target_checksum(candidate_path) != photo.checksum:
+                continue
+
+            with self._claim_lock:
+                if _name_key(candidate_path) in self._claimed_paths:
+                    continue
+                self._claimed_paths.add(_name_key(candidate_path))
+            return candidate_path
+
+        return None
+
     def _copy_file(
         self,
         photo: PhotoFile,
-        target_base: Path,
+        target_base: str,
         dry_run: bool,
-    ) -> str:
+    ) -> CopyResult:
         """
         Copy a single file.
 
-        Returns: 'copied', 'skipped', or 'failed'
+        Safe to call from worker threads, does not touch the database.
+
+        Returns: (status, target_path, error_message) to record for the file
         """
-        source_path = Path(photo.source_path)
+        source_path = photo.source_path
 
         # Check source exists
-        if not source_path.exists():
-            self.db.update_file_status(
-                photo.id, FileStatus.FAILED,
-                error_message="Source file no longer exists"
-            )
-            return 'failed'
+        if not _source_exists(self._source_listings, source_path):
+            return FileStatus.FAILED, None, "Source file no longer exists"
 
         # Skip files without EXIF if requested
         if self.skip_no_exif and photo.exif_date is None:
-            self.db.update_file_status(
-                photo.id, FileStatus.SKIPPED,
-                error_message="No EXIF date available"
-            )
-            return 'skipped'
+            return FileStatus.SKIPPED, None, "No EXIF date available"
 
         # Generate target path (uses file creation date as fallback)
-        target_path = generate_target_path(
+        target_path = _target_path(
             target_base, photo, self.use_file_date_fallback
         )
 
+        # Already copied by an earlier, interrupted run
+        existing_path = self._find_existing_copy(photo, target_path)
+        if existing_path:
+            logger.debug(f"Already copied: {source_path} -> {existing_path}")
+            return FileStatus.COPIED, existing_path, None
+
         # Resolve conflicts
-        target_path = resolve_filename_conflict(target_path)
+        target_path = self._claim_target(target_path)
 
         if dry_run:
             logger.info(f"[DRY RUN] Would copy: {source_path} -> {target_path}")
-            self.db.update_file_status(
-                photo.id, FileStatus.COPIED,
-                target_path=str(target_path)
-            )
-            return 'copied'
+            return FileStatus.COPIED, target_path, None
 
-        # Create target directory
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create target directory (once per run)
+        target_dir = os.path.dirname(target_path)
+        if target_dir not in self._created_dirs:
+            os.makedirs(target_dir, exist_ok=True)
+            self._created_dirs.add(target_dir)
 
         # Copy file with metadata preservation
         try:
-            shutil.copy2(source_path, target_path)
+            fast_copy(source_path, target_path)
             logger.debug(f"Copied: {source_path} -> {target_path}")
+            return FileStatus.COPIED, target_path, None
 
-            self.db.update_file_status(
-                photo.id, FileStatus.COPIED,
-                target_path=str(target_path)
-            )
-            return 'copied'
+        except FileNotFoundError as e:
+            if e.filename != source_path:
+                return FileStatus.FAILED, None, f"Copy failed: {e}"
+            return FileStatus.FAILED, None, "Source file no longer exists"
 
         except Exception as e:
-            self.db.update_file_status(
-                photo.id, FileStatus.FAILED,
-                error_message=f"Copy failed: {e}"
-            )
-            return 'failed'
+            return FileStatus.FAILED, None, f"Copy failed: {e}"
 
     def retry_failed(self, batch_id: int) -> dict:
         """
@@ -285,8 +720,11 @@ class PhotoCopier:
 
         failed_files = self.db.get_files_by_status(batch_id, FileStatus.FAILED)
 
-        for photo in failed_files:
-            self.db.update_file_status(photo.id, FileStatus.PENDING)
+        self.db.update_file_status_bulk(
+            [(photo.id, FileStatus.PENDING, None, None) for photo in failed_files]
+        )
+
+        self.db.update_batch_counts(batch_id)
 
         logger.info(f"Reset {len(failed_files)} failed files to pending")
 
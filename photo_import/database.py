@@ -3,10 +3,11 @@ SQLite database layer for photo import tool.
 """
 
 import sqlite3
+import threading
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, List, Optional
+from typing import Dict, Generator, Iterator, List, Optional, Set, Tuple
 
 from .models import (
     Batch, BatchStatus, PhotoFile, FileStatus, SCHEMA_SQL
@@ -14,32 +15,163 @@ from .models import (
 
 DEFAULT_DB_PATH = "photo_import.db"
 
+# Rows fetched per query when streaming pending files
+PENDING_PAGE_SIZE = 500
+
+# Bound parameters per IN (...) lookup, under SQLite's default limit of 999
+IN_CLAUSE_CHUNK_SIZE = 900
+
+# Per-status aggregates behind every batch statistics dict, folded by
+# _add_status_stats; {f} is the photo_files table prefix
+BATCH_STATS_COLUMNS = """
+    {f}status AS file_status,
+    COUNT({f}id) AS count,
+    SUM({f}exif_date IS NOT NULL) AS with_exif,
+    SUM({f}file_size) AS total_size
+"""
+
+
+def _empty_batch_stats() -> dict:
+    """Statistics of a batch without files; like SUM() over no rows, sums are None."""
+    return {
+        'total': 0, 'pending': None, 'copied': None, 'failed': None,
+        'skipped': None, 'with_exif': None, 'total_size': None,
+    }
+
+
+def _add_status_stats(stats: dict, row: sqlite3.Row):
+    """Add one BATCH_STATS_COLUMNS row (a single file status) to stats."""
+    if row['file_status'] is None:
+        # LEFT JOIN row of a batch without files
+        return
+    if stats['pending'] is None:
+        stats.update(
+            pending=0, copied=0, failed=0, skipped=0,
+            with_exif=0, total_size=0,
+        )
+    stats['total'] += row['count']
+    stats[row['file_status']] += row['count']
+    stats['with_exif'] += row['with_exif']
+    stats['total_size'] += row['total_size']
+
+
+def _convert_timestamp(value: bytes) -> datetime | str:
+    """Convert a TIMESTAMP column to datetime, leaving odd values as text."""
+    text = value.decode()
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return text
+
+
+# Store datetimes as ISO text (same format as sqlite3's old default adapter)
+# and parse TIMESTAMP columns back in the sqlite3 row fetch
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(" "))
+sqlite3.register_converter("TIMESTAMP", _convert_timestamp)
+
+# Applied once when the connection is opened
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA cache_size=-65536",  # 64MB
+)
+
 
 class Database:
     """SQLite database manager for photo imports."""
 
     def __init__(self, db_path: str | Path = DEFAULT_DB_PATH):
         self.db_path = Path(db_path)
+        self._conn = self._connect()
+        # Serializes use of the shared connection between threads
+        self._lock = threading.RLock()
+        self._in_transaction = False
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection shared by all operations on this database."""
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
     def _init_db(self):
         """Initialize database with schema."""
         with self._get_connection() as conn:
             conn.executescript(SCHEMA_SQL)
 
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
     @contextmanager
     def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Get the database connection, committing when the block exits."""
+        with self._lock:
+            if self._in_transaction:
+                # Inside read_transaction() or transaction(): committed there
+                yield self._conn
+                return
+
+            try:
+                yield self._conn
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+
+    @contextmanager
+    def read_transaction(self) -> Generator[None, None, None]:
+        """
+        Run a group of reads inside a single transaction.
+
+        Every query issued within the block shares the same snapshot
+        instead of committing its own.
+        """
+        with self._lock:
+            if self._in_transaction:
+                yield
+                return
+
+            self._conn.execute("BEGIN")
+            self._in_transaction = True
+            try:
+                yield
+            finally:
+                self._in_transaction = False
+                self._conn.commit()
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+        """
+        Run a group of writes as a single transaction.
+
+        Every statement issued within the block is committed once when it
+        exits, or rolled back together if it raises.
+        """
+        with self._lock:
+            if self._in_transaction:
+                yield
+                return
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._in_transaction = True
+            try:
+                yield
+            except BaseException:
+                self._in_transaction = False
+                self._conn.rollback()
+                raise
+            self._in_transaction = False
+            self._conn.commit()
 
     # -------------------------------------------------------------------------
     # Batch Operations
@@ -153,29 +285,41 @@ class Database:
     def update_batch_counts(self, batch_id: int):
         """Update batch file counts from photo_files table."""
         with self._get_connection() as conn:
-            # Get counts
-            counts = conn.execute(
+            conn.execute(
                 """
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as copied,
-                    SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as failed,
-                    SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as skipped
-                FROM photo_files WHERE batch_id = ?
+                UPDATE batches SET (
+                    total_files, scanned_files,
+                    copied_files, failed_files, skipped_files
+                ) = (
+                    SELECT
+                        COUNT(*), COUNT(*),
+                        SUM(status = ?), SUM(status = ?), SUM(status = ?)
+                    FROM photo_files WHERE batch_id = ?
+                )
+                WHERE id = ?
                 """,
                 (FileStatus.COPIED.value, FileStatus.FAILED.value,
-                 FileStatus.SKIPPED.value, batch_id)
-            ).fetchone()
+                 FileStatus.SKIPPED.value, batch_id, batch_id)
+            )
 
+    def increment_batch_counts(
+        self,
+        batch_id: int,
+        copied: int = 0,
+        failed: int = 0,
+        skipped: int = 0,
+    ):
+        """Add to a batch's file counts without recounting photo_files."""
+        with self._get_connection() as conn:
             conn.execute(
                 """
                 UPDATE batches SET
-                    total_files = ?, scanned_files = ?,
-                    copied_files = ?, failed_files = ?, skipped_files = ?
+                    copied_files = COALESCE(copied_files, 0) + ?,
+                    failed_files = COALESCE(failed_files, 0) + ?,
+                    skipped_files = COALESCE(skipped_files, 0) + ?
                 WHERE id = ?
                 """,
-                (counts['total'], counts['total'], counts['copied'],
-                 counts['failed'], counts['skipped'], batch_id)
+                (copied, failed, skipped, batch_id)
             )
 
     def _row_to_batch(self, row: sqlite3.Row) -> Batch:
@@ -291,6 +435,37 @@ class Database:
 
         return [self._row_to_photo_file(row) for row in rows]
 
+    def iter_pending_files(
+        self,
+        batch_id: int,
+        page_size: int = PENDING_PAGE_SIZE,
+    ) -> Iterator[PhotoFile]:
+        """
+        Yield pending files for a batch in source_path order.
+
+        Rows are fetched a page at a time, keyed on source_path rather than
+        an open cursor, so callers can update file status between pages.
+        """
+        last_path = ''
+        while True:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT * FROM photo_files
+                    WHERE batch_id = ? AND status = ? AND source_path > ?
+                    ORDER BY source_path
+                    LIMIT ?
+                    """,
+                    (batch_id, FileStatus.PENDING.value, last_path, page_size)
+                ).fetchall()
+
+            for row in rows:
+                yield self._row_to_photo_file(row)
+
+            if len(rows) < page_size:
+                return
+            last_path = rows[-1]['source_path']
+
     def get_files_by_status(
         self,
         batch_id: int,
@@ -314,6 +489,54 @@ class Database:
 
         return [self._row_to_photo_file(row) for row in rows]
 
+    def get_files_by_status_many(
+        self,
+        batch_ids: List[int],
+        status: FileStatus,
+        limit_per_batch: Optional[int] = None
+    ) -> Dict[int, List[PhotoFile]]:
+        """
+        Get files by status for several batches, keyed by batch ID.
+
+        Uses one windowed query per IN_CLAUSE_CHUNK_SIZE batches to cap
+        each batch at limit_per_batch files; on SQLite builds without window
+        functions (< 3.25) it falls back to one query per batch.
+        """
+        files: Dict[int, List[PhotoFile]] = {batch_id: [] for batch_id in batch_ids}
+        if not batch_ids:
+            return files
+
+        if sqlite3.sqlite_version_info < (3, 25, 0):
+            for batch_id in batch_ids:
+                files[batch_id] = self.get_files_by_status(batch_id, status, limit_per_batch)
+            return files
+
+        with self._get_connection() as conn:
+            for start in range(0, len(batch_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = batch_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                query = f"""
+                    SELECT * FROM (
+                        SELECT *, ROW_NUMBER() OVER (
+                            PARTITION BY batch_id ORDER BY source_path
+                        ) AS batch_row
+                        FROM photo_files
+                        WHERE batch_id IN ({placeholders}) AND status = ?
+                    )
+                """
+                params = [*chunk, status.value]
+
+                if limit_per_batch:
+                    query += " WHERE batch_row <= ?"
+                    params.append(limit_per_batch)
+
+                query += " ORDER BY batch_id, batch_row"
+
+                for row in conn.execute(query, params):
+                    files[row['batch_id']].append(self._row_to_photo_file(row))
+
+        return files
+
     def update_file_status(
         self,
         file_id: int,
@@ -345,6 +568,37 @@ class Database:
                 values
             )
 
+    def update_file_status_bulk(
+        self,
+        updates: List[Tuple[int, FileStatus, Optional[str], Optional[str]]],
+    ):
+        """
+        Update several files' status in a single transaction.
+
+        Each update is (file_id, status, target_path, error_message); None
+        values leave the stored column unchanged, as in update_file_status.
+        """
+        now = datetime.now()
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                UPDATE photo_files SET
+                    status = ?,
+                    target_path = COALESCE(?, target_path),
+                    error_message = COALESCE(?, error_message),
+                    copied_at = COALESCE(?, copied_at)
+                WHERE id = ?
+                """,
+                [
+                    (
+                        status.value, target_path, error_message,
+                        now if status == FileStatus.COPIED else None,
+                        file_id
+                    )
+                    for file_id, status, target_path, error_message in updates
+                ]
+            )
+
     def file_exists(self, source_path: str) -> bool:
         """Check if a file already exists in the database."""
         with self._get_connection() as conn:
@@ -353,25 +607,124 @@ class Database:
             ).fetchone()
         return row is not None
 
+    def get_size_collision_files(self, batch_id: int) -> List[Tuple[int, str]]:
+        """
+        Get (file_id, source_path) for unhashed files in a batch whose size
+        matches another file in the batch - the only possible duplicates.
+        """
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, source_path FROM photo_files
+                WHERE batch_id = ? AND checksum IS NULL AND file_size IN (
+                    SELECT file_size FROM photo_files
+                    WHERE batch_id = ?
+                    GROUP BY file_size HAVING COUNT(*) > 1
+                )
+                ORDER BY source_path
+                """,
+                (batch_id, batch_id)
+            ).fetchall()
+        return [(row['id'], row['source_path']) for row in rows]
+
+    def update_checksums_bulk(self, updates: List[Tuple[int, str]]):
+        """Store checksums for several files; each update is (file_id, checksum)."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                "UPDATE photo_files SET checksum = ? WHERE id = ?",
+                [(checksum, file_id) for file_id, checksum in updates]
+            )
+
+    def existing_source_paths(self, source_paths: List[str]) -> Set[str]:
+        """Return the subset of source_paths already in the database."""
+        existing: Set[str] = set()
+        with self._get_connection() as conn:
+            for start in range(0, len(source_paths), IN_CLAUSE_CHUNK_SIZE):
+                chunk = source_paths[start:start + IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT source_path FROM photo_files WHERE source_path IN ({placeholders})",
+                    chunk
+                )
+                existing.update(row[0] for row in rows)
+        return existing
+
+    def count_files_by_status(self, batch_id: int, status: FileStatus) -> int:
+        """Count files with a given status in a batch."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM photo_files WHERE batch_id = ? AND status = ?",
+                (batch_id, status.value)
+            ).fetchone()
+        return row[0]
+
     def get_batch_stats(self, batch_id: int) -> dict:
         """Get statistics for a batch."""
         with self._get_connection() as conn:
-            row = conn.execute(
-                """
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                    SUM(CASE WHEN status = 'copied' THEN 1 ELSE 0 END) as copied,
-                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                    SUM(CASE WHEN status = 'skipped' THEN 1 ELSE 0 END) as skipped,
-                    SUM(CASE WHEN exif_date IS NOT NULL THEN 1 ELSE 0 END) as with_exif,
-                    SUM(file_size) as total_size
+            rows = conn.execute(
+                f"""
+                SELECT {BATCH_STATS_COLUMNS.format(f='')}
                 FROM photo_files WHERE batch_id = ?
+                GROUP BY status
                 """,
                 (batch_id,)
-            ).fetchone()
+            ).fetchall()
+
+        stats = _empty_batch_stats()
+        for row in rows:
+            _add_status_stats(stats, row)
+        return stats
+
+    def get_batch_stats_many(self, batch_ids: List[int]) -> Dict[int, dict]:
+        """
+        Get statistics for several batches, one query per
+        IN_CLAUSE_CHUNK_SIZE batches.
 
-        return dict(row)
+        Batches without any files get a total of 0 and None for the other
+        stats, matching what get_batch_stats() reports for an empty batch.
+        """
+        if not batch_ids:
+            return {}
+
+        stats = {batch_id: _empty_batch_stats() for batch_id in batch_ids}
+        with self._get_connection() as conn:
+            for start in range(0, len(batch_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = batch_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    SELECT batch_id, {BATCH_STATS_COLUMNS.format(f='')}
+                    FROM photo_files WHERE batch_id IN ({placeholders})
+                    GROUP BY batch_id, status
+                    """,
+                    chunk
+                )
+                for row in rows:
+                    _add_status_stats(stats[row['batch_id']], row)
+
+        return stats
+
+    def get_batch_with_stats(self, batch_id: int) -> Optional[Tuple[Batch, dict]]:
+        """Get a batch together with its statistics in a single query."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT b.*, {BATCH_STATS_COLUMNS.format(f='f.')}
+                FROM batches b
+                LEFT JOIN photo_files f ON f.batch_id = b.id
+                WHERE b.id = ?
+                GROUP BY f.status
+                """,
+                (batch_id,)
+            ).fetchall()
+
+        if not rows:
+            return None
+
+        stats = _empty_batch_stats()
+        for row in rows:
+            _add_status_stats(stats, row)
+        return self._row_to_batch(rows[0]), stats
 
     def _row_to_photo_file(self, row: sqlite3.Row) -> PhotoFile:
         """Convert database row to PhotoFile object."""
@@ -396,9 +749,8 @@ class Database:
     @staticmethod
     def _parse_datetime(value) -> Optional[datetime]:
         """Parse datetime from database value."""
-        if value is None:
-            return None
-        if isinstance(value, datetime):
+        # TIMESTAMP columns normally arrive already converted
+        if value is None or isinstance(value, datetime):
             return value
         if isinstance(value, str):
             try:
@@ -4,10 +4,14 @@ EXIF metadata extraction from photo files.
 Supports JPEG, TIFF, PNG, HEIC, and RAW formats.
 """
 
+import json
 import os
+import shutil
+import struct
+import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Iterable, Optional, Tuple
 import logging
 
 try:
@@ -41,6 +45,11 @@ SUPPORTED_EXTENSIONS = {
     '.webp', '.bmp',
 }
 
+# Same extensions as a tuple, for str.endswith() on lowercased names
+SUPPORTED_SUFFIXES = tuple(SUPPORTED_EXTENSIONS)
+
+PATH_SEPARATORS = os.sep + (os.altsep or '')
+
 # EXIF date tags to try, in order of preference
 EXIF_DATE_TAGS = [
     'EXIF DateTimeOriginal',      # When photo was taken
@@ -58,6 +67,27 @@ PIL_DATE_TAGS = [
     306,    # DateTime
 ]
 
+# TIFF tag IDs used by the header-only reader
+TIFF_EXIF_IFD_POINTER = 0x8769
+TIFF_ASCII_TYPE = 2
+
+# Longest date string read from an IFD ('YYYY:MM:DD HH:MM:SS' plus slack)
+EXIF_MAX_DATE_LENGTH = 64
+
+# JPEG markers: start of image, EXIF/APP1 segment, start of scan
+JPEG_SOI = b'\xff\xd8'
+JPEG_APP1 = 0xE1
+JPEG_SOS = 0xDA
+
+# Flags for the header readers' file descriptors (binary mode on Windows)
+HEADER_OPEN_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+
+# exiftool tags holding the photo date, in order of preference
+EXIFTOOL_DATE_TAGS = ['DateTimeOriginal', 'CreateDate', 'ModifyDate']
+
+# Files passed to exiftool per -execute request
+EXIFTOOL_BATCH_SIZE = 500
+
 # Date formats commonly found in EXIF
 EXIF_DATE_FORMATS = [
     '%Y:%m:%d %H:%M:%S',
@@ -70,8 +100,12 @@ EXIF_DATE_FORMATS = [
 
 def is_supported_photo(filepath: str | Path) -> bool:
     """Check if the file is a supported photo format."""
-    ext = Path(filepath).suffix.lower()
-    return ext in SUPPORTED_EXTENSIONS
+    lower = os.fspath(filepath).lower()
+    if not lower.endswith(SUPPORTED_SUFFIXES):
+        return False
+    # Like Path.suffix, a name that is only the extension has no suffix
+    dot = lower.rfind('.')
+    return dot > 0 and lower[dot - 1] not in PATH_SEPARATORS
 
 
 def parse_exif_date(date_string: str) -> Optional[datetime]:
@@ -86,6 +120,32 @@ def parse_exif_date(date_string: str) -> Optional[datetime]:
     if '.' in date_string:
         date_string = date_string.split('.')[0]
 
+    # Fast path for the fixed-width 'YYYY:MM:DD HH:MM:SS' form (and its
+    # '-' and '/' variants) that nearly every camera writes
+    s = date_string
+    if (
+        len(s) == 19 and s[4] == s[7] and s[4] in ':-/'
+        and s[10] == ' ' and s[13] == ':' and s[16] == ':'
+    ):
+        digits = s[0:4] + s[5:7] + s[8:10] + s[11:13] + s[14:16] + s[17:19]
+        if digits.isascii() and digits.isdigit():
+            try:
+                return datetime(
+                    int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                )
+            except ValueError:
+                pass
+
+    # Date-only 'YYYY:MM:DD' / 'YYYY-MM-DD'
+    if len(s) == 10 and s[4] == s[7] and s[4] in ':-':
+        digits = s[0:4] + s[5:7] + s[8:10]
+        if digits.isascii() and digits.isdigit():
+            try:
+                return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]))
+            except ValueError:
+                pass
+
     for fmt in EXIF_DATE_FORMATS:
         try:
             return datetime.strptime(date_string, fmt)
@@ -138,6 +198,124 @@ def get_exif_date_with_pil(filepath: str | Path) -> Optional[datetime]:
     return None
 
 
+def _pread(fd: int, n: int, offset: int) -> bytes:
+    """Read up to n bytes at offset; falls back to lseek + read without os.pread."""
+    if hasattr(os, 'pread'):
+        return os.pread(fd, n, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, n)
+
+
+def _read_ifd(fd: int, base: int, offset: int, endian: str) -> Dict[int, Tuple[int, int, bytes]]:
+    """
+    Read one TIFF IFD as {tag: (type, count, value_field)}.
+
+    value_field is the entry's raw 4-byte value; for values longer than
+    4 bytes it holds an offset relative to base.
+    """
+    start = base + offset
+    (count,) = struct.unpack(endian + 'H', _pread(fd, 2, start))
+    block = _pread(fd, 12 * count, start + 2)
+    entries = {}
+    for pos in range(0, 12 * count, 12):
+        tag, typ, n = struct.unpack_from(endian + 'HHI', block, pos)
+        entries[tag] = (typ, n, block[pos + 8:pos + 12])
+    return entries
+
+
+def _read_ifd_date(fd: int, base: int, endian: str, entry: Tuple[int, int, bytes]) -> Optional[datetime]:
+    """Decode an ASCII date entry from an IFD."""
+    typ, n, value_field = entry
+    if typ != TIFF_ASCII_TYPE:
+        return None
+    if n > 4:
+        (value_offset,) = struct.unpack(endian + 'I', value_field)
+        raw = _pread(fd, min(n, EXIF_MAX_DATE_LENGTH), base + value_offset)
+    else:
+        raw = value_field[:n]
+    raw = raw.split(b'\0', 1)[0]
+    return parse_exif_date(raw.decode('ascii', errors='replace'))
+
+
+def _read_tiff_date(fd: int, base: int) -> Optional[datetime]:
+    """Find the EXIF date in a TIFF structure starting at file offset base."""
+    header = _pread(fd, 8, base)
+    byte_order = header[:2]
+    if byte_order == b'II':
+        endian = '<'
+    elif byte_order == b'MM':
+        endian = '>'
+    else:
+        return None
+
+    magic, ifd0_offset = struct.unpack_from(endian + 'HI', header, 2)
+    if magic != 42:
+        return None
+
+    tags = _read_ifd(fd, base, ifd0_offset, endian)
+    if TIFF_EXIF_IFD_POINTER in tags:
+        (exif_offset,) = struct.unpack(endian + 'I', tags[TIFF_EXIF_IFD_POINTER][2])
+        tags.update(_read_ifd(fd, base, exif_offset, endian))
+
+    for tag_id in PIL_DATE_TAGS:
+        if tag_id in tags:
+            date = _read_ifd_date(fd, base, endian, tags[tag_id])
+            if date:
+                return date
+    return None
+
+
+def _find_jpeg_exif(fd: int) -> Optional[int]:
+    """Return the file offset of the TIFF header in a JPEG's EXIF segment."""
+    pos = 2
+    while True:
+        header = _pread(fd, 10, pos)
+        if len(header) < 4 or header[0] != 0xFF:
+            return None
+        marker = header[1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            pos += 1
+            continue
+        if marker == JPEG_SOS:
+            return None
+
+        (length,) = struct.unpack_from('>H', header, 2)
+        if marker == JPEG_APP1 and header[4:10] == b'Exif\0\0':
+            return pos + 10
+        pos += 2 + length
+
+
+def get_exif_date_from_header(filepath: str | Path) -> Optional[datetime]:
+    """
+    Extract the EXIF date from JPEG and TIFF-based files without a library.
+
+    Only the JPEG segment headers, the TIFF header, the IFD entries and the
+    date strings are read, each with a small positioned read. Returns None
+    for other formats or when no date is found.
+    """
+    try:
+        fd = os.open(filepath, HEADER_OPEN_FLAGS)
+        try:
+            magic = _pread(fd, 4, 0)
+            if magic[:2] == JPEG_SOI:
+                base = _find_jpeg_exif(fd)
+                if base is None:
+                    return None
+            elif magic in (b'II*\0', b'MM\0*'):
+                base = 0
+            else:
+                return None
+            return _read_tiff_date(fd, base)
+        finally:
+            os.close(fd)
+    except (OSError, struct.error) as e:
+        # struct.error: truncated data
+        logger.debug(f"Header EXIF read failed for {filepath}: {e}")
+
+    return None
+
+
 def get_exif_date(filepath: str | Path) -> Optional[datetime]:
     """
     Extract the original creation date from EXIF metadata.
@@ -151,33 +329,146 @@ def get_exif_date(filepath: str | Path) -> Optional[datetime]:
         logger.warning(f"File not found: {filepath}")
         return None
 
+    return read_exif_date(filepath)
+
+
+def read_exif_date(filepath: str | Path) -> Optional[datetime]:
+    """
+    Extract the EXIF date from a file already known to exist.
+
+    Same as get_exif_date() without the existence check, for callers that
+    have just stat'ed the file.
+    """
     if not is_supported_photo(filepath):
         logger.debug(f"Unsupported file type: {filepath}")
         return None
 
-    # Try exifread first (better for RAW formats)
-    date = get_exif_date_with_exifread(filepath)
-    if date:
-        return date
-
-    # Fall back to PIL
-    date = get_exif_date_with_pil(filepath)
-    if date:
-        return date
+    ext = os.path.splitext(filepath)[1].lower()
+    for reader in EXIF_READERS.get(ext, DEFAULT_EXIF_READERS):
+        date = reader(filepath)
+        if date:
+            return date
 
     logger.debug(f"No EXIF date found for: {filepath}")
     return None
 
 
-def get_file_dates(filepath: str | Path) -> Tuple[datetime, datetime]:
+# Readers to try per extension, in order. JPEG, TIFF and TIFF-based RAW
+# files are read from the header, with exifread for the odd layouts the
+# header reader rejects; PIL cannot read RAW files and would only re-read
+# what the header reader already saw. BMP has no EXIF at all.
+_HEADER_READERS = (get_exif_date_from_header, get_exif_date_with_exifread)
+DEFAULT_EXIF_READERS = (get_exif_date_with_exifread, get_exif_date_with_pil)
+EXIF_READERS = {
+    **dict.fromkeys(('.jpg', '.jpeg', '.jpe', '.jif', '.jfif', '.tif', '.tiff'), _HEADER_READERS),
+    **dict.fromkeys(
+        ('.raw', '.cr2', '.cr3', '.nef', '.arw', '.dng', '.orf', '.rw2', '.pef', '.srw'),
+        _HEADER_READERS,
+    ),
+    '.bmp': (),
+}
+
+
+def batch_get_exif_dates(
+    filepaths: Iterable[str | Path],
+) -> Dict[str, Optional[datetime]]:
+    """
+    Extract EXIF dates for many files with a single exiftool process.
+
+    exiftool is kept running in -stay_open mode and fed the paths in
+    batches, so its startup cost is paid once rather than per file.
+
+    Returns:
+        Dictionary mapping each path exiftool reported on (as str) to its
+        date, or None if it has no date. Files missing from the result
+        (or everything, if exiftool is not installed) should be read with
+        get_exif_date().
+    """
+    exiftool = shutil.which('exiftool')
+    if not exiftool:
+        logger.debug("exiftool not found, skipping batch EXIF extraction")
+        return {}
+
+    # Paths exiftool would misread as options or split across lines
+    paths = [
+        str(p) for p in filepaths
+        if '\n' not in str(p) and not str(p).startswith('-')
+    ]
+    wanted = {os.path.normpath(p): p for p in paths}
+    dates: Dict[str, Optional[datetime]] = {}
+
+    try:
+        proc = subprocess.Popen(
+            [
+                exiftool, '-stay_open', 'True', '-@', '-',
+                '-common_args', '-json', '-n', '-charset', 'filename=utf8',
+                *(f'-{tag}' for tag in EXIFTOOL_DATE_TAGS),
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+    except OSError as e:
+        logger.debug(f"Could not start exiftool: {e}")
+        return {}
+
+    try:
+        for start in range(0, len(paths), EXIFTOOL_BATCH_SIZE):
+            chunk = paths[start:start + EXIFTOOL_BATCH_SIZE]
+            proc.stdin.write(('\n'.join(chunk) + '\n-execute\n').encode('utf-8'))
+            proc.stdin.flush()
+
+            # Output ends with a {ready} line once the request is done
+            output = []
+            for line in proc.stdout:
+                if line.strip() == b'{ready}':
+                    break
+                output.append(line)
+            else:
+                raise RuntimeError("exiftool exited unexpectedly")
+
+            text = b''.join(output).decode('utf-8', errors='replace').strip()
+            for record in json.loads(text) if text else []:
+                path = wanted.get(os.path.normpath(record.get('SourceFile', '')))
+                if path is None:
+                    continue
+                dates[path] = None
+                for tag in EXIFTOOL_DATE_TAGS:
+                    date = parse_exif_date(record.get(tag))
+                    if date:
+                        dates[path] = date
+                        break
+
+    except Exception as e:
+        logger.warning(f"exiftool batch extraction failed: {e}")
+
+    finally:
+        try:
+            proc.stdin.write(b'-stay_open\nFalse\n')
+            proc.stdin.close()
+            proc.wait(timeout=10)
+        except Exception:
+            proc.kill()
+
+    return dates
+
+
+def get_file_dates(
+    filepath: str | Path,
+    stat: Optional[os.stat_result] = None,
+) -> Tuple[datetime, datetime]:
     """
     Get file creation and modification dates from filesystem.
 
+    Args:
+        filepath: File to read dates for
+        stat: Result of os.stat(filepath) if the caller already has it
+
     Returns:
         Tuple of (creation_date, modification_date)
     """
-    filepath = Path(filepath)
-    stat = filepath.stat()
+    if stat is None:
+        stat = os.stat(filepath)
 
     # On macOS/Windows, st_birthtime is the creation time
     # On Linux, st_ctime is the metadata change time (not creation)
@@ -204,12 +495,13 @@ def get_photo_metadata(filepath: str | Path) -> dict:
         - extension: str
     """
     filepath = Path(filepath)
-    creation_date, modification_date = get_file_dates(filepath)
+    stat = filepath.stat()
+    creation_date, modification_date = get_file_dates(filepath, stat)
 
     return {
-        'exif_date': get_exif_date(filepath),
+        'exif_date': read_exif_date(filepath),
         'creation_date': creation_date,
         'modification_date': modification_date,
-        'file_size': filepath.stat().st_size,
+        'file_size': stat.st_size,
         'extension': filepath.suffix.lower(),
     }
@@ -11,23 +11,103 @@ import os
 import re
 import shutil
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Callable, List, Tuple
+from typing import Any, Dict, Optional, Callable, List, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
-# Patterns for date-named directories
-DATE_PATTERNS = [
-    # 2012_05_20 or 2012-05-20
-    (re.compile(r'^(\d{4})[-_](\d{2})[-_](\d{2})$'), '{0}/{1}/{2}'),
-    # 20120520
-    (re.compile(r'^(\d{4})(\d{2})(\d{2})$'), '{0}/{1}/{2}'),
-    # 2012_05 or 2012-05
-    (re.compile(r'^(\d{4})[-_](\d{2})$'), '{0}/{1}'),
-    # 201205
-    (re.compile(r'^(\d{4})(\d{2})$'), '{0}/{1}'),
-]
+# Date-named directories, matched in a single pass:
+#   2012_05_20, 2012-05-20, 20120520 -> 2012/05/20
+#   2012_05, 2012-05, 201205         -> 2012/05
+DATE_DIRECTORY_PATTERN = re.compile(
+    r'^(?P<year>\d{4})(?:'
+    r'[-_](?P<month>\d{2})(?:[-_](?P<day>\d{2}))?'
+    r'|(?P<compact_month>\d{2})(?P<compact_day>\d{2})?'
+    r')$'
+)
+
+# Threads moving/copying files within one date directory
+EXPAND_WORKERS = 8
+
+# Entries kept in each directory listing cache (least recently used evicted)
+DIRECTORY_CACHE_SIZE = 64
+
+# get_directory_tree: (root, max_depth) -> ({dir: mtime_ns}, tree)
+_tree_cache: "OrderedDict[Tuple[str, int], Tuple[Dict[str, int], dict]]" = OrderedDict()
+
+# list_images_in_directory: (root, relative_path) -> (mtime_ns, images)
+_images_cache: "OrderedDict[Tuple[str, str], Tuple[int, List[dict]]]" = OrderedDict()
+
+_cache_lock = threading.Lock()
+
+
+def _cache_get(cache: OrderedDict, key: tuple) -> Optional[Any]:
+    """Look up a directory cache entry, marking it recently used."""
+    with _cache_lock:
+        entry = cache.get(key)
+        if entry is not None:
+            cache.move_to_end(key)
+        return entry
+
+
+def _cache_put(cache: OrderedDict, key: tuple, entry: Any):
+    """Store a directory cache entry, evicting the least recently used."""
+    with _cache_lock:
+        cache[key] = entry
+        cache.move_to_end(key)
+        while len(cache) > DIRECTORY_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def _with_sizes(node: dict, root: str) -> dict:
+    """
+    Copy a cached directory tree node, filling in each file's current size.
+
+    Sizes are not cached: rewriting a file in place leaves its directory's
+    modification time unchanged. Files that have since disappeared are left out.
+    """
+    node = dict(node)
+    children = node.get("children")
+    if children is not None:
+        node["children"] = []
+        for child in children:
+            if child["type"] == "file":
+                try:
+                    size = os.stat(os.path.join(root, child["path"])).st_size
+                except OSError:
+                    continue
+                child = dict(child, size=size)
+            elif child["type"] == "directory":
+                child = _with_sizes(child, root)
+            else:
+                child = dict(child)
+            node["children"].append(child)
+    return node
+
+
+def _image_sizes(images: List[dict], root: str) -> List[dict]:
+    """Copy a cached image listing, filling in each file's current size."""
+    result = []
+    for image in images:
+        try:
+            size = os.stat(os.path.join(root, image["path"])).st_size
+        except OSError:
+            continue
+        result.append(dict(image, size=size))
+    return result
+
+
+def _mtime_ns(path: str | Path) -> Optional[int]:
+    """Modification time of a path, or None if it cannot be stat'ed."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
 
 @dataclass
@@ -41,6 +121,7 @@ class ExpandResult:
     errors: List[Tuple[str, str]]  # (path, error message)
 
 
+@lru_cache(maxsize=4096)
 def parse_date_directory(dirname: str) -> Optional[str]:
     """
     Parse a date-based directory name and return the hierarchical path.
@@ -51,23 +132,64 @@ def parse_date_directory(dirname: str) -> Optional[str]:
     Returns:
         Hierarchical path like '2012/05/20' or None if not a date directory
     """
-    for pattern, template in DATE_PATTERNS:
-        match = pattern.match(dirname)
-        if match:
-            groups = match.groups()
-            # Validate date components
-            year = int(groups[0])
-            month = int(groups[1])
-            if year < 1900 or year > 2100:
-                continue
-            if month < 1 or month > 12:
-                continue
-            if len(groups) > 2:
-                day = int(groups[2])
-                if day < 1 or day > 31:
-                    continue
-            return template.format(*groups)
-    return None
+    match = DATE_DIRECTORY_PATTERN.match(dirname)
+    if not match:
+        return None
+
+    year = match['year']
+    month = match['month'] or match['compact_month']
+    day = match['day'] or match['compact_day']
+
+    # Validate date components
+    if not 1900 <= int(year) <= 2100:
+        return None
+    if not 1 <= int(month) <= 12:
+        return None
+    if day is None:
+        return f"{year}/{month}"
+    if not 1 <= int(day) <= 31:
+        return None
+    return f"{year}/{month}/{day}"
+
+
+def _plan_directory(dir_path: Path, new_path: Path) -> List[Tuple[Path, Path, bool]]:
+    """
+    Plan how to expand one date directory into new_path.
+
+    Returns (source, destination, is_tree) operations: files go one by one,
+    subdirectories move or copy as a whole unless they must be merged
+    into an existing destination, in which case their files are listed.
+    """
+    plan = []
+    for item in dir_path.iterdir():
+        dest = new_path / item.name
+        if item.is_file():
+            plan.append((item, dest, False))
+        elif item.is_dir():
+            if dest.exists():
+                # Merge into existing
+                for sub_item in item.rglob('*'):
+                    if sub_item.is_file():
+                        plan.append((sub_item, dest / sub_item.relative_to(item), False))
+            else:
+                plan.append((item, dest, True))
+    return plan
+
+
+def _execute_operation(src: Path, dest: Path, is_tree: bool, moving: bool) -> int:
+    """Move or copy one planned file or directory; returns the files handled."""
+    if moving:
+        shutil.move(str(src), str(dest))
+    elif is_tree:
+        shutil.copytree(str(src), str(dest))
+    else:
+        shutil.copy2(str(src), str(dest))
+    return _count_files(dest) if is_tree else 1
+
+
+def _count_files(directory: Path) -> int:
+    """Count the files below a directory."""
+    return sum(len(files) for _, _, files in os.walk(directory))
 
 
 def expand_directories(
@@ -98,11 +220,12 @@ def expand_directories(
 
     # Find all date-named directories
     date_dirs = []
-    for item in source_path.iterdir():
-        if item.is_dir():
-            expanded = parse_date_directory(item.name)
-            if expanded:
-                date_dirs.append((item, expanded))
+    with os.scandir(source_path) as entries:
+        for entry in entries:
+            # Parse the name first; it is cheaper than the is_dir() check
+            expanded = parse_date_directory(entry.name)
+            if expanded and entry.is_dir():
+                date_dirs.append((Path(entry.path), expanded))
 
     result = ExpandResult(
         source_dir=str(source_path),
@@ -115,72 +238,72 @@ def expand_directories(
 
     total = len(date_dirs)
 
-    for idx, (dir_path, expanded_path) in enumerate(date_dirs):
-        if progress_callback:
-            progress_callback(idx, total, dir_path.name)
+    with ThreadPoolExecutor(max_workers=EXPAND_WORKERS) as executor:
+        for idx, (dir_path, expanded_path) in enumerate(date_dirs):
+            if progress_callback:
+                progress_callback(idx, total, dir_path.name)
 
-        try:
-            new_path = target_path / expanded_path
-
-            if dry_run:
-                logger.info(f"Would expand: {dir_path.name} -> {expanded_path}")
-                result.dirs_processed += 1
-                # Count files that would be moved
-                for _ in dir_path.rglob('*'):
-                    if _.is_file():
-                        result.files_moved += 1
-                continue
-
-            # Create target directory structure
-            new_path.mkdir(parents=True, exist_ok=True)
-
-            # Move/copy contents
-            for item in dir_path.iterdir():
-                dest = new_path / item.name
-                if item.is_file():
-                    if source_path == target_path or move_files:
-                        shutil.move(str(item), str(dest))
+            try:
+                new_path = target_path / expanded_path
+
+                if dry_run:
+                    logger.info(f"Would expand: {dir_path.name} -> {expanded_path}")
+                    result.dirs_processed += 1
+                    # Count files that would be moved
+                    result.files_moved += _count_files(dir_path)
+                    continue
+
+                in_place = source_path == target_path
+                moving = in_place or move_files
+
+                # In-place with nothing to merge into: move the whole directory
+                # in one rename
+                if in_place and not new_path.exists():
+                    new_path.parent.mkdir(parents=True, exist_ok=True)
+                    try:
+                        os.rename(dir_path, new_path)
+                    except OSError as e:
+                        # e.g. EXDEV across filesystems - move file by file below
+                        logger.debug(f"Rename of {dir_path} failed, moving files: {e}")
                     else:
-                        shutil.copy2(str(item), str(dest))
-                    result.files_moved += 1
-                elif item.is_dir():
-                    # Handle nested directories
-                    if dest.exists():
-                        # Merge into existing
-                        for sub_item in item.rglob('*'):
-                            if sub_item.is_file():
-                                rel_path = sub_item.relative_to(item)
-                                sub_dest = dest / rel_path
-                                sub_dest.parent.mkdir(parents=True, exist_ok=True)
-                                if source_path == target_path or move_files:
-                                    shutil.move(str(sub_item), str(sub_dest))
-                                else:
-                                    shutil.copy2(str(sub_item), str(sub_dest))
-                                result.files_moved += 1
+                        result.files_moved += _count_files(new_path)
+                        result.dirs_processed += 1
+                        continue
+
+                # Plan every operation first, create each target directory
+                # once, then run the moves/copies, which are independent
+                plan = _plan_directory(dir_path, new_path)
+                for parent in sorted({new_path} | {dest.parent for _, dest, _ in plan}):
+                    os.makedirs(parent, exist_ok=True)
+
+                futures = [
+                    (src, executor.submit(_execute_operation, src, dest, is_tree, moving))
+                    for src, dest, is_tree in plan
+                ]
+                failed = False
+                for src, future in futures:
+                    try:
+                        result.files_moved += future.result()
+                    except Exception as e:
+                        logger.error(f"Error expanding {src}: {e}")
+                        result.errors.append((str(src), str(e)))
+                        failed = True
+
+                # Remove original directory if it's in-place expansion
+                if in_place:
+                    # Check if directory is empty
+                    remaining = list(dir_path.iterdir())
+                    if not remaining:
+                        dir_path.rmdir()
                     else:
-                        if source_path == target_path or move_files:
-                            shutil.move(str(item), str(dest))
-                        else:
-                            shutil.copytree(str(item), str(dest))
-                        # Count files
-                        for _ in dest.rglob('*'):
-                            if _.is_file():
-                                result.files_moved += 1
-
-            # Remove original directory if it's in-place expansion
-            if source_path == target_path:
-                # Check if directory is empty
-                remaining = list(dir_path.iterdir())
-                if not remaining:
-                    dir_path.rmdir()
-                else:
-                    logger.warning(f"Directory not empty after move: {dir_path}")
-
-            result.dirs_processed += 1
-
-        except Exception as e:
-            logger.error(f"Error processing {dir_path}: {e}")
-            result.errors.append((str(dir_path), str(e)))
+                        logger.warning(f"Directory not empty after move: {dir_path}")
+
+                if not failed:
+                    result.dirs_processed += 1
+
+            except Exception as e:
+                logger.error(f"Error processing {dir_path}: {e}")
+                result.errors.append((str(dir_path), str(e)))
 
     if progress_callback:
         progress_callback(total, total, "Done")
@@ -196,15 +319,29 @@ def get_directory_tree(root_dir: str, max_depth: int = 4) -> dict:
         root_dir: Root directory to scan
         max_depth: Maximum depth to scan
 
+    The directory structure is cached and reused while none of the scanned
+    directories' modification times change; file sizes are read on every call.
+
     Returns:
         Dictionary with tree structure
     """
     root_path = Path(root_dir).resolve()
+    key = (str(root_path), max_depth)
+
+    cached = _cache_get(_tree_cache, key)
+    if cached is not None:
+        dir_mtimes, tree = cached
+        if all(_mtime_ns(d) == mtime for d, mtime in dir_mtimes.items()):
+            return _with_sizes(tree, str(root_path))
+
+    dir_mtimes: Dict[str, int] = {}
 
     def scan_dir(path: Path, depth: int) -> dict:
         if depth > max_depth:
             return {"type": "truncated"}
 
+        dir_mtimes[str(path)] = _mtime_ns(path)
+
         result = {
             "name": path.name or str(path),
             "path": str(path.relative_to(root_path)) if path != root_path else ".",
@@ -229,7 +366,7 @@ def get_directory_tree(root_dir: str, max_depth: int = 4) -> dict:
                         "path": str(item.relative_to(root_path)),
                         "type": "file",
                         "extension": ext,
-                        "size": item.stat().st_size,
+                        "size": None,  # Filled in by _with_sizes
                         "is_image": ext in {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic', '.heif', '.bmp', '.tiff', '.tif'},
                     })
         except PermissionError:
@@ -237,7 +374,9 @@ def get_directory_tree(root_dir: str, max_depth: int = 4) -> dict:
 
         return result
 
-    return scan_dir(root_path, 0)
+    tree = scan_dir(root_path, 0)
+    _cache_put(_tree_cache, key, (dir_mtimes, tree))
+    return _with_sizes(tree, str(root_path))
 
 
 def list_images_in_directory(root_dir: str, relative_path: str = ".") -> List[dict]:
@@ -248,6 +387,9 @@ def list_images_in_directory(root_dir: str, relative_path: str = ".") -> List[di
         root_dir: Root directory
         relative_path: Relative path within root
 
+    The listing is cached until the directory's modification time changes;
+    file sizes are read on every call.
+
     Returns:
         List of image info dictionaries
     """
@@ -257,6 +399,12 @@ def list_images_in_directory(root_dir: str, relative_path: str = ".") -> List[di
     if not target_path.is_dir():
         return []
 
+    key = (str(root_path), relative_path)
+    mtime = _mtime_ns(target_path)
+    cached = _cache_get(_images_cache, key)
+    if cached is not None and cached[0] == mtime:
+        return _image_sizes(cached[1], str(root_path))
+
     image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.webp', '.heic', '.heif', '.bmp', '.tiff', '.tif'}
     images = []
 
@@ -265,8 +413,9 @@ def list_images_in_directory(root_dir: str, relative_path: str = ".") -> List[di
             images.append({
                 "name": item.name,
                 "path": str(item.relative_to(root_path)),
-                "size": item.stat().st_size,
+                "size": None,  # Filled in by _image_sizes
                 "extension": item.suffix.lower(),
             })
 
-    return images
+    _cache_put(_images_cache, key, (mtime, images))
+    return _image_sizes(images, str(root_path))
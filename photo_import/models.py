@@ -26,7 +26,7 @@ class BatchStatus(str, Enum):
     PAUSED = "paused"        # Paused/interrupted
 
 
-@dataclass
+@dataclass(slots=True)
 class PhotoFile:
     """Represents a photo file with its metadata."""
     id: Optional[int]
@@ -46,7 +46,7 @@ class PhotoFile:
     checksum: Optional[str]  # MD5 for duplicate detection
 
 
-@dataclass
+@dataclass(slots=True)
 class Batch:
     """Represents a batch of files to be processed."""
     id: Optional[int]
@@ -108,6 +108,8 @@ CREATE TABLE IF NOT EXISTS photo_files (
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_photo_files_batch_id ON photo_files(batch_id);
 CREATE INDEX IF NOT EXISTS idx_photo_files_status ON photo_files(status);
+CREATE INDEX IF NOT EXISTS idx_photo_files_batch_status_path ON photo_files(batch_id, status, source_path);
+DROP INDEX IF EXISTS idx_photo_files_batch_status;
 CREATE INDEX IF NOT EXISTS idx_photo_files_source_path ON photo_files(source_path);
 CREATE INDEX IF NOT EXISTS idx_photo_files_checksum ON photo_files(checksum);
 CREATE INDEX IF NOT EXISTS idx_photo_files_exif_date ON photo_files(exif_date);
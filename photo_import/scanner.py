@@ -7,15 +7,18 @@ Uses parallel processing for fast scanning of large photo collections.
 import hashlib
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, Optional, Callable, List
+from typing import Dict, Generator, Iterator, Optional, Callable, List, Tuple
 import multiprocessing
 
 from .database import Database
 from .exif_reader import (
-    get_exif_date, get_file_dates, is_supported_photo, SUPPORTED_EXTENSIONS
+    batch_get_exif_dates, get_file_dates, is_supported_photo, read_exif_date,
+    SUPPORTED_EXTENSIONS, SUPPORTED_SUFFIXES
 )
 from .models import Batch, BatchStatus, PhotoFile, FileStatus
 
@@ -30,14 +33,45 @@ BULK_INSERT_SIZE = 500
 # Default number of worker threads (I/O bound, so more than CPU count is fine)
 DEFAULT_WORKERS = min(32, (multiprocessing.cpu_count() or 1) * 4)
 
+# Default number of worker processes (one per CPU core)
+DEFAULT_PROCESS_WORKERS = multiprocessing.cpu_count() or 1
+
+# Files sent to a worker process per task, amortizes pickling and IPC
+SCAN_CHUNK_SIZE = 32
+
+# Tasks queued per scan worker, bounds memory use on large trees
+SCAN_QUEUE_FACTOR = 4
+
+
+def _fadvise(fd: int, advice_name: str):
+    """Give the kernel a page cache hint for fd, where supported (Linux)."""
+    advice = getattr(os, advice_name, None)
+    if advice is None:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
 
 def calculate_checksum(filepath: Path) -> str:
     """Calculate MD5 checksum of a file."""
-    md5 = hashlib.md5()
     with open(filepath, 'rb') as f:
-        for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b''):
-            md5.update(chunk)
-    return md5.hexdigest()
+        # Read ahead aggressively, and drop the pages once hashed so a large
+        # scan does not push everything else out of the page cache
+        fd = f.fileno()
+        _fadvise(fd, 'POSIX_FADV_SEQUENTIAL')
+        try:
+            # Python 3.11+: hash with a reused buffer, no per-chunk allocations
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'md5').hexdigest()
+
+            md5 = hashlib.md5()
+            for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b''):
+                md5.update(chunk)
+            return md5.hexdigest()
+        finally:
+            _fadvise(fd, 'POSIX_FADV_DONTNEED')
 
 
 def discover_photos(directory: Path) -> Generator[Path, None, None]:
@@ -60,66 +94,98 @@ def discover_photos(directory: Path) -> Generator[Path, None, None]:
                 yield filepath
 
 
-def discover_photos_fast(directory: Path) -> List[Path]:
+def discover_photos_fast(directory: str | Path) -> List[str]:
     """
     Recursively discover all photo files in a directory.
 
-    Returns a list for parallel processing.
+    Same walk as discover_photos (hidden entries and symlinked directories
+    are skipped), but uses os.scandir directly and returns path strings,
+    without building a Path per directory entry. Returns a list for
+    parallel processing.
     """
     photos = []
-    for root, dirs, files in os.walk(directory):
-        # Skip hidden directories
-        dirs[:] = [d for d in dirs if not d.startswith('.')]
+    pending_dirs = [str(directory)]
 
-        for filename in files:
-            # Skip hidden files
-            if filename.startswith('.'):
-                continue
+    while pending_dirs:
+        current = pending_dirs.pop()
+        subdirs = []
 
-            filepath = Path(root) / filename
-            if is_supported_photo(filepath):
-                photos.append(filepath)
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    name = entry.name
+
+                    # Skip hidden files and directories
+                    if name.startswith('.'):
+                        continue
+
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+
+                    if is_dir:
+                        if not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif name.lower().endswith(SUPPORTED_SUFFIXES):
+                        photos.append(entry.path)
+        except OSError as e:
+            logger.debug(f"Cannot list {current}: {e}")
+            continue
+
+        # Visit subdirectories in listing order, like os.walk
+        pending_dirs.extend(reversed(subdirs))
 
     return photos
 
 
 def process_single_file(
-    filepath: Path,
+    filepath: str | Path,
     batch_id: int,
-    calculate_checksums: bool
+    calculate_checksums: bool,
+    exif_dates: Optional[Dict[str, Optional[datetime]]] = None,
+    scanned_at: Optional[datetime] = None,
 ) -> Optional[PhotoFile]:
     """
     Process a single file - extract metadata and create PhotoFile record.
 
-    This function is designed to be called in parallel.
+    This function is designed to be called in parallel. EXIF dates found
+    in exif_dates (from batch_get_exif_dates) are used without reading
+    the file again. scanned_at defaults to now; a scan passes its start
+    time for every file.
     """
     try:
-        creation_date, modification_date = get_file_dates(filepath)
-        exif_date = get_exif_date(filepath)
+        # One stat serves the dates and size and confirms the file exists
+        path = str(filepath)
+        stat = os.stat(path)
+        creation_date, modification_date = get_file_dates(path, stat)
+
+        if exif_dates and path in exif_dates:
+            exif_date = exif_dates[path]
+        else:
+            exif_date = read_exif_date(path)
 
         checksum = None
         if calculate_checksums:
             try:
-                checksum = calculate_checksum(filepath)
+                checksum = calculate_checksum(path)
             except Exception as e:
                 logger.debug(f"Failed to calculate checksum for {filepath}: {e}")
 
-        stat = filepath.stat()
-
         return PhotoFile(
             id=None,
             batch_id=batch_id,
-            source_path=str(filepath),
-            filename=filepath.name,
+            source_path=path,
+            filename=os.path.basename(path),
             file_size=stat.st_size,
-            file_extension=filepath.suffix.lower(),
+            file_extension=os.path.splitext(path)[1].lower(),
             exif_date=exif_date,
             file_creation_date=creation_date,
             file_modification_date=modification_date,
             target_path=None,
             status=FileStatus.PENDING,
             error_message=None,
-            scanned_at=datetime.now(),
+            scanned_at=scanned_at or datetime.now(),
             copied_at=None,
             checksum=checksum,
         )
@@ -128,6 +194,30 @@ def process_single_file(
         return None
 
 
+def process_file_chunk(
+    filepaths: List[str],
+    batch_id: int,
+    calculate_checksums: bool,
+    exif_dates: Optional[Dict[str, Optional[datetime]]] = None,
+    scanned_at: Optional[datetime] = None,
+) -> List[Optional[PhotoFile]]:
+    """Run process_single_file over several files in one worker task."""
+    return [
+        process_single_file(filepath, batch_id, calculate_checksums, exif_dates, scanned_at)
+        for filepath in filepaths
+    ]
+
+
+def _chunk_results(future: Future, chunk: List[str]) -> Iterator[Tuple[str, Optional[PhotoFile]]]:
+    """Pair a finished process_file_chunk task's results with its paths."""
+    try:
+        return zip(chunk, future.result())
+    except Exception as e:
+        # The whole task failed, e.g. a worker process died
+        logger.warning(f"Error processing {len(chunk)} files from {chunk[0]}: {e}")
+        return ((filepath, None) for filepath in chunk)
+
+
 class PhotoScanner:
     """Scanner to discover and catalog photos in a directory."""
 
@@ -137,6 +227,9 @@ class PhotoScanner:
         calculate_checksums: bool = True,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
         num_workers: Optional[int] = None,
+        use_exiftool: bool = False,
+        use_processes: bool = False,
+        defer_checksums: bool = False,
     ):
         """
         Initialize the scanner.
@@ -146,11 +239,22 @@ class PhotoScanner:
             calculate_checksums: Whether to calculate MD5 checksums
             progress_callback: Optional callback(scanned, total, current_file)
             num_workers: Number of parallel workers (default: auto)
+            use_exiftool: Read EXIF dates in bulk with exiftool if installed
+            use_processes: Process files in worker processes instead of
+                threads, so EXIF parsing and hashing are not limited by the GIL
+            defer_checksums: Skip hashing during the scan and afterwards
+                checksum only files whose size matches another file in the
+                batch (see compute_duplicate_checksums)
         """
         self.db = db
         self.calculate_checksums = calculate_checksums
         self.progress_callback = progress_callback
-        self.num_workers = num_workers or DEFAULT_WORKERS
+        self.use_exiftool = use_exiftool
+        self.use_processes = use_processes
+        self.defer_checksums = defer_checksums
+        self.num_workers = num_workers or (
+            DEFAULT_PROCESS_WORKERS if use_processes else DEFAULT_WORKERS
+        )
 
     def scan(
         self,
@@ -209,67 +313,60 @@ class PhotoScanner:
         )
 
         # Filter out already processed files
-        files_to_process = []
-        for filepath in all_photos:
-            if not self.db.file_exists(str(filepath)):
-                files_to_process.append(filepath)
+        existing = self.db.existing_source_paths(all_photos)
+        files_to_process = [p for p in all_photos if p not in existing]
 
         skipped = total_files - len(files_to_process)
         if skipped > 0:
             logger.info(f"Skipping {skipped} already processed files")
 
+        exif_dates = {}
+        if self.use_exiftool and files_to_process:
+            logger.info("Reading EXIF dates with exiftool...")
+            exif_dates = batch_get_exif_dates(files_to_process)
+
         logger.info(f"Processing {len(files_to_process)} files with {self.num_workers} workers...")
 
         # Process files in parallel
         scanned = skipped
         photo_buffer = []
 
-        try:
-            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-                # Submit all tasks
-                future_to_path = {
-                    executor.submit(
-                        process_single_file,
-                        filepath,
-                        batch.id,
-                        self.calculate_checksums
-                    ): filepath
-                    for filepath in files_to_process
-                }
-
-                # Process results as they complete
-                for future in as_completed(future_to_path):
-                    filepath = future_to_path[future]
-                    scanned += 1
-
-                    try:
-                        photo = future.result()
-                        if photo:
-                            photo_buffer.append(photo)
-
-                            # Bulk insert when buffer is full
-                            if len(photo_buffer) >= BULK_INSERT_SIZE:
-                                self.db.add_photo_files_bulk(photo_buffer)
-                                photo_buffer.clear()
-
-                    except Exception as e:
-                        logger.warning(f"Error processing {filepath}: {e}")
-
-                    # Update progress
-                    if self.progress_callback:
-                        self.progress_callback(scanned, total_files, str(filepath))
+        scanned_at = datetime.now()
 
-                    # Update batch progress periodically
-                    if scanned % 500 == 0:
-                        self.db.update_batch_status(
-                            batch.id, BatchStatus.SCANNING,
-                            scanned_files=scanned,
-                            last_processed_path=str(filepath)
-                        )
+        try:
+            # Process results as they complete
+            for filepath, photo in self._process_files(
+                files_to_process, batch.id, exif_dates, scanned_at
+            ):
+                scanned += 1
+
+                if photo:
+                    photo_buffer.append(photo)
+
+                    # Bulk insert when buffer is full
+                    if len(photo_buffer) >= BULK_INSERT_SIZE:
+                        self.db.add_photo_files_bulk(photo_buffer)
+                        photo_buffer.clear()
+
+                # Update progress
+                if self.progress_callback:
+                    self.progress_callback(scanned, total_files, str(filepath))
+
+                # Update batch progress periodically
+                if scanned % 500 == 0:
+                    self.db.update_batch_status(
+                        batch.id, BatchStatus.SCANNING,
+                        scanned_files=scanned,
+                        last_processed_path=str(filepath)
+                    )
 
             # Insert remaining photos
             if photo_buffer:
                 self.db.add_photo_files_bulk(photo_buffer)
+                photo_buffer.clear()
+
+            if self.calculate_checksums and self.defer_checksums:
+                self.compute_duplicate_checksums(batch.id)
 
             # Mark scan as complete
             self.db.update_batch_counts(batch.id)
@@ -300,3 +397,107 @@ class PhotoScanner:
             raise
 
         return self.db.get_batch(batch.id)
+
+    def _process_files(
+        self,
+        filepaths: List[str],
+        batch_id: int,
+        exif_dates: Dict[str, Optional[datetime]],
+        scanned_at: datetime,
+    ) -> Iterator[Tuple[str, Optional[PhotoFile]]]:
+        """
+        Run process_single_file over filepaths, yielding (path, photo)
+        pairs as files finish; photo is None for files that failed.
+
+        Worker processes get SCAN_CHUNK_SIZE files per task, each chunk
+        with only its own prefetched EXIF dates so workers are not sent
+        the whole dict. At most num_workers * SCAN_QUEUE_FACTOR tasks are
+        queued at any time.
+        """
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        chunk_size = SCAN_CHUNK_SIZE if self.use_processes else 1
+        calculate_checksums = self.calculate_checksums and not self.defer_checksums
+        max_queued = self.num_workers * SCAN_QUEUE_FACTOR
+
+        executor = executor_class(max_workers=self.num_workers)
+        try:
+            in_flight = {}
+            for start in range(0, len(filepaths), chunk_size):
+                chunk = filepaths[start:start + chunk_size]
+                known_dates = {
+                    path: exif_dates[path] for path in chunk if path in exif_dates
+                }
+                future = executor.submit(
+                    process_file_chunk, chunk, batch_id, calculate_checksums,
+                    known_dates or None, scanned_at,
+                )
+                in_flight[future] = chunk
+
+                if len(in_flight) >= max_queued:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from _chunk_results(future, in_flight.pop(future))
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from _chunk_results(future, in_flight.pop(future))
+        finally:
+            # Don't start queued files after an interrupt or error
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def compute_duplicate_checksums(self, batch_id: int) -> int:
+        """
+        Checksum the files in a batch that could be duplicates.
+
+        Only files sharing their size with another file in the batch are
+        hashed; a file with a unique size cannot have an identical copy.
+
+        Returns:
+            Number of checksums stored
+        """
+        candidates = self.db.get_size_collision_files(batch_id)
+        if not candidates:
+            return 0
+
+        logger.info(f"Calculating checksums for {len(candidates)} possible duplicates...")
+
+        max_queued = self.num_workers * SCAN_QUEUE_FACTOR
+        updates = []
+        stored = 0
+        # hashlib releases the GIL while hashing, so threads are enough here
+        executor = ThreadPoolExecutor(max_workers=self.num_workers)
+        try:
+            in_flight = {}
+            pending = iter(candidates)
+            while True:
+                # Keep at most max_queued files submitted
+                for file_id, source_path in pending:
+                    future = executor.submit(calculate_checksum, source_path)
+                    in_flight[future] = (file_id, source_path)
+                    if len(in_flight) >= max_queued:
+                        break
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_id, source_path = in_flight.pop(future)
+                    try:
+                        updates.append((file_id, future.result()))
+                    except Exception as e:
+                        logger.debug(f"Failed to calculate checksum for {source_path}: {e}")
+
+                if len(updates) >= BULK_INSERT_SIZE:
+                    self.db.update_checksums_bulk(updates)
+                    stored += len(updates)
+                    updates.clear()
+        finally:
+            # Don't start queued hashes after an interrupt or error
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if updates:
+            self.db.update_checksums_bulk(updates)
+            stored += len(updates)
+
+        return stored
@@ -3,23 +3,29 @@ Video copier module - copies videos to date-based directory structure.
 """
 
 import logging
-import shutil
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 
+from .copier import COPY_QUEUE_FACTOR, _date_folder, _name_key, _source_exists, fast_copy
 from .video_database import VideoDatabase
-from .video_models import VideoBatchStatus, VideoFile, VideoFileStatus
+from .video_models import PendingVideo, VideoBatchStatus, VideoFile, VideoFileStatus
 
 logger = logging.getLogger(__name__)
 
 # Number of files to process per commit
 COMMIT_BATCH_SIZE = 50
 
+# Outcome of copying one file: (status, target_path, error_message)
+VideoCopyResult = Tuple[VideoFileStatus, Optional[str], Optional[str]]
+
 
 def generate_target_path(
     target_base: Path,
-    video: VideoFile,
+    video: VideoFile | PendingVideo,
     use_file_date_fallback: bool = True,
 ) -> Path:
     """
@@ -34,12 +40,21 @@ def generate_target_path(
 
     Args:
         target_base: Base directory for organized videos
-        video: VideoFile record with dates
+        video: VideoFile (or PendingVideo) record with dates
         use_file_date_fallback: If True, use file date when no metadata
 
     Returns:
         Target path (always returns a valid path using file date as fallback)
     """
+    return Path(_target_path(str(target_base), video, use_file_date_fallback))
+
+
+def _target_path(
+    target_base: str,
+    video: VideoFile | PendingVideo,
+    use_file_date_fallback: bool,
+) -> str:
+    """String version of generate_target_path used on the copy hot path."""
     # Prefer metadata date
     date = video.metadata_date
 
@@ -52,8 +67,8 @@ def generate_target_path(
         date = video.file_modification_date or datetime.now()
 
     # Format: YYYY_MM_DD
-    date_folder = date.strftime("%Y_%m_%d")
-    return target_base / date_folder / video.filename
+    date_folder = _date_folder(date.year, date.month, date.day)
+    return os.path.join(target_base, date_folder, video.filename)
 
 
 def resolve_filename_conflict(target_path: Path) -> Path:
@@ -93,6 +108,7 @@ class VideoCopier:
         use_file_date_fallback: bool = True,
         skip_no_metadata: bool = False,
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
+        max_workers: int = 1,
     ):
         """
         Initialize the copier.
@@ -102,11 +118,29 @@ class VideoCopier:
             use_file_date_fallback: Use file date when metadata not available
             skip_no_metadata: Skip files without metadata date
             progress_callback: Optional callback(copied, total, current_file)
+            max_workers: Number of files to copy in parallel threads
         """
         self.db = db
         self.use_file_date_fallback = use_file_date_fallback
         self.skip_no_metadata = skip_no_metadata
         self.progress_callback = progress_callback
+        self.max_workers = max(1, max_workers)
+
+        # Status updates not yet written to the database
+        self._pending_status: List[Tuple[int, VideoFileStatus, Optional[str], Optional[str]]] = []
+        # Copies finished after an interrupt, never yielded by _run_copies
+        self._unreported: List[Tuple[PendingVideo, VideoCopyResult]] = []
+
+        # Source directory listings, read once per run (None if the
+        # directory could not be listed)
+        self._source_listings: Dict[str, Optional[FrozenSet[str]]] = {}
+        # Target directory -> names taken there (on disk or claimed this run)
+        self._dir_cache: Dict[str, Set[str]] = {}
+        self._claim_lock = threading.Lock()
+        # (target directory, name) -> next conflict suffix to try
+        self._next_suffix: Dict[Tuple[str, str], int] = {}
+        # Target directories created (or found to exist) this run
+        self._created_dirs: Set[str] = set()
 
     def copy(self, batch_id: int, dry_run: bool = False) -> dict:
         """
@@ -132,11 +166,20 @@ class VideoCopier:
                 f"Batch {batch_id} is in status {batch.status}, cannot copy"
             )
 
-        target_base = Path(batch.target_directory)
+        target_base = batch.target_directory
 
         # Update batch status to copying
         self.db.update_batch_status(batch_id, VideoBatchStatus.COPYING)
 
+        # File system state may have changed since any earlier run
+        self._source_listings.clear()
+        self._dir_cache.clear()
+        self._next_suffix.clear()
+        self._created_dirs.clear()
+
+        self._unreported.clear()
+        results = None
+
         stats = {
             'total': 0,
             'copied': 0,
@@ -146,28 +189,26 @@ class VideoCopier:
         }
 
         try:
-            # Process pending files
-            pending_files = self.db.get_pending_files(batch_id)
-            stats['total'] = len(pending_files)
+            # Process pending files, streamed from the database
+            pending_files = self.db.iter_pending_files(batch_id)
+            stats['total'] = self.db.count_files_by_status(batch_id, VideoFileStatus.PENDING)
 
             logger.info(f"Starting copy of {stats['total']} video files")
 
-            for i, video in enumerate(pending_files):
-                try:
-                    result = self._copy_file(video, target_base, dry_run)
-
-                    if result == 'copied':
-                        stats['copied'] += 1
-                    elif result == 'skipped':
-                        stats['skipped'] += 1
-                    else:
-                        stats['failed'] += 1
-
-                except Exception as e:
-                    logger.error(f"Error processing {video.source_path}: {e}")
-                    self.db.update_file_status(
-                        video.id, VideoFileStatus.FAILED, error_message=str(e)
-                    )
+            # Copies may run in worker threads, status updates are
+            # recorded here on the calling thread only
+            results = self._run_copies(pending_files, target_base, dry_run)
+            for i, (video, result) in enumerate(results):
+                status, target_path, error_message = result
+                self._pending_status.append(
+                    (video.id, status, target_path, error_message)
+                )
+
+                if status == VideoFileStatus.COPIED:
+                    stats['copied'] += 1
+                elif status == VideoFileStatus.SKIPPED:
+                    stats['skipped'] += 1
+                else:
                     stats['failed'] += 1
 
                 # Progress callback
@@ -176,28 +217,35 @@ class VideoCopier:
                         i + 1, stats['total'], video.source_path
                     )
 
-                # Periodic batch count update
+                # Periodic status and batch count update
                 if (i + 1) % COMMIT_BATCH_SIZE == 0:
-                    self.db.update_batch_counts(batch_id)
+                    self._flush_status(batch_id)
 
-            # Final update
+            # Final update, recounting to correct any drift
+            self._flush_status(batch_id)
             self.db.update_batch_counts(batch_id)
 
-            # Mark batch as complete if no pending files remain
-            remaining = self.db.get_pending_files(batch_id, limit=1)
+            # Mark batch as complete if no pending files remain; every file
+            # pending at the start has been given a new status by now
+            processed = stats['copied'] + stats['skipped'] + stats['failed']
+            remaining = max(0, stats['total'] - processed)
             if not remaining:
                 self.db.update_batch_status(batch_id, VideoBatchStatus.COMPLETED)
                 logger.info("Video batch completed successfully")
             else:
-                logger.info(f"{len(remaining)} video files still pending")
+                logger.info(f"{remaining} video files still pending")
 
         except KeyboardInterrupt:
             logger.info("Video copy interrupted by user")
+            self._record_unreported(results)
+            self._flush_status(batch_id)
             self.db.update_batch_status(batch_id, VideoBatchStatus.PAUSED)
             raise
 
         except Exception as e:
             logger.error(f"Video copy failed: {e}")
+            self._record_unreported(results)
+            self._flush_status(batch_id)
             self.db.update_batch_status(batch_id, VideoBatchStatus.PAUSED)
             raise
 
@@ -206,73 +254,181 @@ class VideoCopier:
 
         return stats
 
+    def _record_unreported(self, results: Optional[Iterator]):
+        """Stop the copy pool and buffer the results it never yielded."""
+        if results is not None:
+            results.close()
+        for video, (status, target_path, error_message) in self._unreported:
+            self._pending_status.append((video.id, status, target_path, error_message))
+        self._unreported.clear()
+
+    def _flush_status(self, batch_id: int):
+        """Write buffered file status updates and the batch's new counts."""
+        if not self._pending_status:
+            return
+
+        statuses = [update[1] for update in self._pending_status]
+        with self.db.transaction():
+            self.db.update_file_status_bulk(self._pending_status)
+            self.db.increment_batch_counts(
+                batch_id,
+                copied=statuses.count(VideoFileStatus.COPIED),
+                failed=statuses.count(VideoFileStatus.FAILED),
+                skipped=statuses.count(VideoFileStatus.SKIPPED),
+            )
+        self._pending_status.clear()
+
+    def _run_copies(
+        self,
+        videos: Iterable[PendingVideo],
+        target_base: str,
+        dry_run: bool,
+    ) -> Iterator[Tuple[PendingVideo, VideoCopyResult]]:
+        """
+        Copy files, yielding (video, result) pairs as copies finish.
+
+        With max_workers > 1 copies run in a thread pool and results are
+        yielded in completion order; at most max_workers * COPY_QUEUE_FACTOR
+        copies are queued at any time.
+        """
+        if self.max_workers == 1:
+            for video in videos:
+                yield video, self._safe_copy_file(video, target_base, dry_run)
+            return
+
+        max_queued = self.max_workers * COPY_QUEUE_FACTOR
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        in_flight = {}
+        try:
+            for video in videos:
+                future = executor.submit(
+                    self._safe_copy_file, video, target_base, dry_run
+                )
+                in_flight[future] = video
+
+                if len(in_flight) >= max_queued:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield in_flight.pop(future), future.result()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield in_flight.pop(future), future.result()
+        finally:
+            # Don't start queued copies after an interrupt or error
+            executor.shutdown(wait=True, cancel_futures=True)
+            # Copies already running have finished on disk; keep their
+            # results so they are recorded instead of left pending
+            for future, video in in_flight.items():
+                if not future.cancelled():
+                    self._unreported.append((video, future.result()))
+
+    def _safe_copy_file(
+        self,
+        video: PendingVideo,
+        target_base: str,
+        dry_run: bool,
+    ) -> VideoCopyResult:
+        """Copy a single file, turning unexpected errors into a failed result."""
+        try:
+            return self._copy_file(video, target_base, dry_run)
+        except Exception as e:
+            logger.error(f"Error processing {video.source_path}: {e}")
+            return VideoFileStatus.FAILED, None, str(e)
+
+    def _claim_target(self, target_path: str) -> str:
+        """
+        Resolve filename conflicts for target_path and reserve the result.
+
+        Same naming as resolve_filename_conflict, but each target directory
+        is listed once, and repeated conflicts on one name resume counting
+        where the last one stopped instead of probing from _1 again.
+        """
+        parent, name = os.path.split(target_path)
+
+        with self._claim_lock:
+            names = self._dir_cache.get(parent)
+            if names is None:
+                try:
+                    names = {_name_key(entry) for entry in os.listdir(parent)}
+                except FileNotFoundError:
+                    names = set()
+                self._dir_cache[parent] = names
+
+            new_name = name
+            if _name_key(new_name) in names:
+                stem, suffix = os.path.splitext(name)
+                counter_key = (parent, _name_key(name))
+                counter = self._next_suffix.get(counter_key, 1)
+                while _name_key(f"{stem}_{counter}{suffix}") in names:
+                    counter += 1
+                new_name = f"{stem}_{counter}{suffix}"
+                self._next_suffix[counter_key] = counter + 1
+                if counter > 100:
+                    logger.info(f"High conflict count ({counter}): {name} -> {new_name}")
+
+            names.add(_name_key(new_name))
+
+        return os.path.join(parent, new_name)
+
     def _copy_file(
         self,
-        video: VideoFile,
-        target_base: Path,
+        video: PendingVideo,
+        target_base: str,
         dry_run: bool,
-    ) -> str:
+    ) -> VideoCopyResult:
         """
         Copy a single video file.
 
-        Returns: 'copied', 'skipped', or 'failed'
+        Safe to call from worker threads, does not touch the database.
+
+        Returns: (status, target_path, error_message) to record for the file
         """
-        source_path = Path(video.source_path)
+        source_path = video.source_path
 
         # Check source exists
-        if not source_path.exists():
+        if not _source_exists(self._source_listings, source_path):
             error_msg = f"Source file no longer exists: {source_path}"
             logger.warning(error_msg)
-            self.db.update_file_status(
-                video.id, VideoFileStatus.FAILED,
-                error_message="Source file no longer exists"
-            )
-            return 'failed'
+            return VideoFileStatus.FAILED, None, "Source file no longer exists"
 
         # Skip files without metadata if requested
         if self.skip_no_metadata and video.metadata_date is None:
-            self.db.update_file_status(
-                video.id, VideoFileStatus.SKIPPED,
-                error_message="No metadata date available"
-            )
-            return 'skipped'
+            return VideoFileStatus.SKIPPED, None, "No metadata date available"
 
         # Generate target path (uses file creation date as fallback)
-        target_path = generate_target_path(
+        target_path = _target_path(
             target_base, video, self.use_file_date_fallback
         )
 
         # Resolve conflicts
-        target_path = resolve_filename_conflict(target_path)
+        target_path = self._claim_target(target_path)
 
         if dry_run:
             logger.info(f"[DRY RUN] Would copy: {source_path} -> {target_path}")
-            self.db.update_file_status(
-                video.id, VideoFileStatus.COPIED,
-                target_path=str(target_path)
-            )
-            return 'copied'
+            return VideoFileStatus.COPIED, target_path, None
 
-        # Create target directory
-        target_path.parent.mkdir(parents=True, exist_ok=True)
+        # Create target directory (once per run)
+        target_dir = os.path.dirname(target_path)
+        if target_dir not in self._created_dirs:
+            os.makedirs(target_dir, exist_ok=True)
+            self._created_dirs.add(target_dir)
 
-        # Copy file with metadata preservation
+        # Copy file with metadata preservation (reflink/in-kernel on Linux)
         try:
-            shutil.copy2(source_path, target_path)
+            fast_copy(source_path, target_path)
             logger.debug(f"Copied: {source_path} -> {target_path}")
+            return VideoFileStatus.COPIED, target_path, None
 
-            self.db.update_file_status(
-                video.id, VideoFileStatus.COPIED,
-                target_path=str(target_path)
-            )
-            return 'copied'
+        except FileNotFoundError as e:
+            # Removed after its directory was listed
+            if e.filename != source_path:
+                return VideoFileStatus.FAILED, None, f"Copy failed: {e}"
+            return VideoFileStatus.FAILED, None, "Source file no longer exists"
 
         except Exception as e:
-            self.db.update_file_status(
-                video.id, VideoFileStatus.FAILED,
-                error_message=f"Copy failed: {e}"
-            )
-            return 'failed'
+            return VideoFileStatus.FAILED, None, f"Copy failed: {e}"
 
     def retry_failed(self, batch_id: int) -> dict:
         """
@@ -288,8 +444,11 @@ class VideoCopier:
 
         failed_files = self.db.get_files_by_status(batch_id, VideoFileStatus.FAILED)
 
-        for video in failed_files:
-            self.db.update_file_status(video.id, VideoFileStatus.PENDING)
+        self.db.update_file_status_bulk(
+            [(video.id, VideoFileStatus.PENDING, None, None) for video in failed_files]
+        )
+
+        self.db.update_batch_counts(batch_id)
 
         logger.info(f"Reset {len(failed_files)} failed video files to pending")
 
@@ -4,13 +4,16 @@ Database operations for video import tool.
 
 import sqlite3
 import logging
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Generator, Iterator, List, Optional, Set, Tuple
 from contextlib import contextmanager
 
+from .database import CONNECTION_PRAGMAS, IN_CLAUSE_CHUNK_SIZE, PENDING_PAGE_SIZE
 from .video_models import (
-    VideoFile, VideoBatch, VideoFileStatus, VideoBatchStatus, VIDEO_SCHEMA_SQL
+    PendingVideo, VideoFile, VideoBatch, VideoFileStatus, VideoBatchStatus,
+    VIDEO_SCHEMA_SQL
 )
 
 logger = logging.getLogger(__name__)
@@ -22,25 +25,69 @@ class VideoDatabase:
     def __init__(self, db_path: str = "video_import.db"):
         """Initialize database connection."""
         self.db_path = db_path
+        self._conn = self._connect()
+        # Serializes use of the shared connection between threads
+        self._lock = threading.RLock()
+        self._in_transaction = False
         self._init_db()
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection shared by all operations on this database."""
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
     def _init_db(self):
         """Initialize database schema."""
         with self._get_connection() as conn:
             conn.executescript(VIDEO_SCHEMA_SQL)
-            conn.commit()
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
     @contextmanager
-    def _get_connection(self):
-        """Get a database connection with proper settings."""
-        conn = sqlite3.connect(self.db_path, timeout=30)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        try:
-            yield conn
-        finally:
-            conn.close()
+    def _get_connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Get the database connection, committing when the block exits."""
+        with self._lock:
+            if self._in_transaction:
+                # Inside transaction(): committed there
+                yield self._conn
+                return
+
+            try:
+                yield self._conn
+                self._conn.commit()
+            except BaseException:
+                self._conn.rollback()
+                raise
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+        """
+        Run a group of writes as a single transaction.
+
+        Every statement issued within the block is committed once when it
+        exits, or rolled back together if it raises.
+        """
+        with self._lock:
+            if self._in_transaction:
+                yield
+                return
+
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._in_transaction = True
+            try:
+                yield
+            except BaseException:
+                self._in_transaction = False
+                self._conn.rollback()
+                raise
+            self._in_transaction = False
+            self._conn.commit()
 
     def create_batch(
         self,
@@ -57,7 +104,6 @@ class VideoDatabase:
                 """,
                 (source_directory, target_directory, VideoBatchStatus.SCANNING.value, datetime.now())
             )
-            conn.commit()
 
             return self.get_batch(cursor.lastrowid)
 
@@ -152,32 +198,43 @@ class VideoDatabase:
                 f"UPDATE video_batches SET {', '.join(updates)} WHERE id = ?",
                 params
             )
-            conn.commit()
 
     def update_batch_counts(self, batch_id: int):
         """Update batch file counts from actual file statuses."""
         with self._get_connection() as conn:
-            stats = conn.execute(
+            conn.execute(
                 """
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'copied' THEN 1 ELSE 0 END) as copied,
-                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                    SUM(CASE WHEN status = 'skipped' THEN 1 ELSE 0 END) as skipped
-                FROM video_files WHERE batch_id = ?
+                UPDATE video_batches SET (
+                    total_files, copied_files, failed_files, skipped_files
+                ) = (
+                    SELECT COUNT(*), SUM(status = ?), SUM(status = ?), SUM(status = ?)
+                    FROM video_files WHERE batch_id = ?
+                )
+                WHERE id = ?
                 """,
-                (batch_id,)
-            ).fetchone()
+                (VideoFileStatus.COPIED.value, VideoFileStatus.FAILED.value,
+                 VideoFileStatus.SKIPPED.value, batch_id, batch_id)
+            )
 
+    def increment_batch_counts(
+        self,
+        batch_id: int,
+        copied: int = 0,
+        failed: int = 0,
+        skipped: int = 0,
+    ):
+        """Add to a batch's file counts without recounting video_files."""
+        with self._get_connection() as conn:
             conn.execute(
                 """
-                UPDATE video_batches
-                SET total_files = ?, copied_files = ?, failed_files = ?, skipped_files = ?
+                UPDATE video_batches SET
+                    copied_files = COALESCE(copied_files, 0) + ?,
+                    failed_files = COALESCE(failed_files, 0) + ?,
+                    skipped_files = COALESCE(skipped_files, 0) + ?
                 WHERE id = ?
                 """,
-                (stats['total'], stats['copied'], stats['failed'], stats['skipped'], batch_id)
+                (copied, failed, skipped, batch_id)
             )
-            conn.commit()
 
     def add_video_file(self, video: VideoFile) -> int:
         """Add a video file record."""
@@ -204,7 +261,6 @@ class VideoDatabase:
                     video.checksum,
                 )
             )
-            conn.commit()
             return cursor.lastrowid
 
     def add_video_files_bulk(self, videos: List[VideoFile]):
@@ -235,7 +291,6 @@ class VideoDatabase:
                     for v in videos
                 ]
             )
-            conn.commit()
 
     def file_exists(self, source_path: str) -> bool:
         """Check if a file has already been processed."""
@@ -246,6 +301,20 @@ class VideoDatabase:
             ).fetchone()
             return row is not None
 
+    def existing_source_paths(self, source_paths: List[str]) -> Set[str]:
+        """Return the subset of source_paths already in the database."""
+        existing: Set[str] = set()
+        with self._get_connection() as conn:
+            for start in range(0, len(source_paths), IN_CLAUSE_CHUNK_SIZE):
+                chunk = source_paths[start:start + IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"SELECT source_path FROM video_files WHERE source_path IN ({placeholders})",
+                    chunk
+                )
+                existing.update(row[0] for row in rows)
+        return existing
+
     def get_pending_files(
         self,
         batch_id: int,
@@ -264,6 +333,74 @@ class VideoDatabase:
             rows = conn.execute(query, (batch_id,)).fetchall()
             return [self._row_to_file(row) for row in rows]
 
+    def iter_pending_files(
+        self,
+        batch_id: int,
+        page_size: int = PENDING_PAGE_SIZE,
+    ) -> Iterator[PendingVideo]:
+        """
+        Yield pending files for a batch in id order, for copying.
+
+        Only the columns the copier reads are fetched and converted. Rows
+        are fetched a page at a time, keyed on id rather than an open
+        cursor, so callers can update file status between pages.
+        """
+        parse = self._parse_datetime
+        last_id = 0
+        while True:
+            with self._get_connection() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT id, source_path, filename, metadata_date,
+                           file_creation_date, file_modification_date
+                    FROM video_files
+                    WHERE batch_id = ? AND status = ? AND id > ?
+                    ORDER BY id
+                    LIMIT ?
+                    """,
+                    (batch_id, VideoFileStatus.PENDING.value, last_id, page_size)
+                ).fetchall()
+
+            for file_id, source_path, filename, metadata, created, modified in rows:
+                yield PendingVideo(
+                    file_id, source_path, filename,
+                    parse(metadata), parse(created), parse(modified),
+                )
+
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1]['id']
+
+    def count_files_by_status(self, batch_id: int, status: VideoFileStatus) -> int:
+        """Count files with a given status in a batch."""
+        with self._get_connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM video_files WHERE batch_id = ? AND status = ?",
+                (batch_id, status.value)
+            ).fetchone()
+        return row[0]
+
+    def get_unhashed_files(self, batch_id: int) -> List[Tuple[int, str]]:
+        """Get (file_id, source_path) for files in a batch without a checksum."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT id, source_path FROM video_files
+                WHERE batch_id = ? AND checksum IS NULL
+                ORDER BY source_path
+                """,
+                (batch_id,)
+            ).fetchall()
+        return [(row['id'], row['source_path']) for row in rows]
+
+    def update_checksums_bulk(self, updates: List[Tuple[int, str]]):
+        """Store checksums for several files; each update is (file_id, checksum)."""
+        with self._get_connection() as conn:
+            conn.executemany(
+                "UPDATE video_files SET checksum = ? WHERE id = ?",
+                [(checksum, file_id) for file_id, checksum in updates]
+            )
+
     def get_files_by_status(
         self,
         batch_id: int,
@@ -313,7 +450,39 @@ class VideoDatabase:
                 f"UPDATE video_files SET {', '.join(updates)} WHERE id = ?",
                 params
             )
-            conn.commit()
+
+    def update_file_status_bulk(
+        self,
+        updates: List[Tuple[int, VideoFileStatus, Optional[str], Optional[str]]],
+    ):
+        """
+        Update several files' status in a single transaction.
+
+        Each update is (file_id, status, target_path, error_message); None
+        values leave the stored column unchanged, as in update_file_status.
+        """
+        # One timestamp per flush, bound as text so the datetime adapter
+        # doesn't run for every copied file
+        now = datetime.now().isoformat(" ")
+        with self._get_connection() as conn:
+            conn.executemany(
+                """
+                UPDATE video_files SET
+                    status = ?,
+                    target_path = COALESCE(?, target_path),
+                    error_message = COALESCE(?, error_message),
+                    copied_at = COALESCE(?, copied_at)
+                WHERE id = ?
+                """,
+                [
+                    (
+                        status.value, target_path, error_message,
+                        now if status == VideoFileStatus.COPIED else None,
+                        file_id
+                    )
+                    for file_id, status, target_path, error_message in updates
+                ]
+            )
 
     def get_batch_stats(self, batch_id: int) -> dict:
         """Get statistics for a batch."""
@@ -335,6 +504,50 @@ class VideoDatabase:
 
             return dict(row)
 
+    def get_batch_stats_many(self, batch_ids: List[int]) -> Dict[int, dict]:
+        """
+        Get statistics for several batches, one query per
+        IN_CLAUSE_CHUNK_SIZE batches.
+
+        Batches without any files get a total of 0 and None for the other
+        stats, matching what get_batch_stats() reports for an empty batch.
+        """
+        if not batch_ids:
+            return {}
+
+        stats = {
+            batch_id: {
+                'total': 0, 'pending': None, 'copied': None, 'failed': None,
+                'skipped': None, 'with_metadata': None, 'total_size': None,
+            }
+            for batch_id in batch_ids
+        }
+        with self._get_connection() as conn:
+            for start in range(0, len(batch_ids), IN_CLAUSE_CHUNK_SIZE):
+                chunk = batch_ids[start:start + IN_CLAUSE_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    f"""
+                    SELECT
+                        batch_id,
+                        COUNT(*) as total,
+                        SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
+                        SUM(CASE WHEN status = 'copied' THEN 1 ELSE 0 END) as copied,
+                        SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
+                        SUM(CASE WHEN status = 'skipped' THEN 1 ELSE 0 END) as skipped,
+                        SUM(CASE WHEN metadata_date IS NOT NULL THEN 1 ELSE 0 END) as with_metadata,
+                        SUM(file_size) as total_size
+                    FROM video_files WHERE batch_id IN ({placeholders})
+                    GROUP BY batch_id
+                    """,
+                    chunk
+                )
+                for row in rows:
+                    row_stats = dict(row)
+                    stats[row_stats.pop('batch_id')] = row_stats
+
+        return stats
+
     def _row_to_batch(self, row: sqlite3.Row) -> VideoBatch:
         """Convert a database row to a VideoBatch object."""
         return VideoBatch(
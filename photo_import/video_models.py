@@ -5,7 +5,7 @@ Database models and schema for video import tool.
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import NamedTuple, Optional
 
 
 class VideoFileStatus(str, Enum):
@@ -46,6 +46,16 @@ class VideoFile:
     checksum: Optional[str]  # MD5 for duplicate detection
 
 
+class PendingVideo(NamedTuple):
+    """The fields of a pending video file that copying needs."""
+    id: int
+    source_path: str
+    filename: str
+    metadata_date: Optional[datetime]
+    file_creation_date: datetime
+    file_modification_date: datetime
+
+
 @dataclass
 class VideoBatch:
     """Represents a batch of video files to be processed."""
@@ -107,7 +117,8 @@ CREATE TABLE IF NOT EXISTS video_files (
 
 -- Indexes for performance
 CREATE INDEX IF NOT EXISTS idx_video_files_batch_id ON video_files(batch_id);
-CREATE INDEX IF NOT EXISTS idx_video_files_status ON video_files(status);
+CREATE INDEX IF NOT EXISTS idx_video_files_batch_status ON video_files(batch_id, status);
+DROP INDEX IF EXISTS idx_video_files_status;
 CREATE INDEX IF NOT EXISTS idx_video_files_source_path ON video_files(source_path);
 CREATE INDEX IF NOT EXISTS idx_video_files_checksum ON video_files(checksum);
 CREATE INDEX IF NOT EXISTS idx_video_files_metadata_date ON video_files(metadata_date);
@@ -6,13 +6,18 @@ and optional ffprobe if available.
 """
 
 import os
+import shutil
+import struct
 import subprocess
 import json
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple
 import logging
 
+from .exif_reader import HEADER_OPEN_FLAGS, _pread
+
 logger = logging.getLogger(__name__)
 
 # Supported video extensions
@@ -29,11 +34,40 @@ SUPPORTED_VIDEO_EXTENSIONS = {
     '.mpg', '.mpeg', '.vob', '.divx', '.asf',
 }
 
+# Same extensions without the dot, for matching the text after a name's last dot
+SUPPORTED_VIDEO_EXTENSION_NAMES = frozenset(ext[1:] for ext in SUPPORTED_VIDEO_EXTENSIONS)
+
+PATH_SEPARATORS = os.sep + (os.altsep or '')
+
+# Format tags holding the recording date, in order of preference
+FFPROBE_DATE_TAGS = ['creation_time', 'date', 'DATE']
+
+# ISO base media (QuickTime/MP4) containers, whose movie header is read directly
+ISO_BMFF_EXTENSIONS = {'.mp4', '.m4v', '.mov', '.3gp', '.3g2'}
+
+# Seconds between the QuickTime epoch (1904-01-01) and the Unix epoch
+QUICKTIME_EPOCH_OFFSET = 2082844800
+
 
 def is_supported_video(filepath: str | Path) -> bool:
     """Check if the file is a supported video format."""
-    ext = Path(filepath).suffix.lower()
-    return ext in SUPPORTED_VIDEO_EXTENSIONS
+    path = os.fspath(filepath)
+    dot = path.rfind('.')
+    # Like Path.suffix, a name that is only the extension has no suffix
+    return (
+        dot > 0
+        and path[dot - 1] not in PATH_SEPARATORS
+        and path[dot + 1:].lower() in SUPPORTED_VIDEO_EXTENSION_NAMES
+    )
+
+
+@lru_cache(maxsize=None)
+def _find_ffprobe() -> Optional[str]:
+    """Locate ffprobe once, rather than failing a process spawn per file."""
+    ffprobe = shutil.which('ffprobe')
+    if not ffprobe:
+        logger.debug("ffprobe not found, using file dates only")
+    return ffprobe
 
 
 def get_video_date_ffprobe(filepath: str | Path) -> Optional[datetime]:
@@ -42,12 +76,18 @@ def get_video_date_ffprobe(filepath: str | Path) -> Optional[datetime]:
 
     Looks for creation_time in format metadata.
     """
+    ffprobe = _find_ffprobe()
+    if not ffprobe:
+        return None
+
     try:
+        # Only the date tags are requested, so ffprobe skips printing the
+        # rest of the format section
         result = subprocess.run(
             [
-                'ffprobe', '-v', 'quiet',
+                ffprobe, '-v', 'quiet',
                 '-print_format', 'json',
-                '-show_format',
+                '-show_entries', 'format_tags=' + ','.join(FFPROBE_DATE_TAGS),
                 str(filepath)
             ],
             capture_output=True,
@@ -60,7 +100,7 @@ def get_video_date_ffprobe(filepath: str | Path) -> Optional[datetime]:
             tags = data.get('format', {}).get('tags', {})
 
             # Try different tag names
-            for tag in ['creation_time', 'date', 'DATE']:
+            for tag in FFPROBE_DATE_TAGS:
                 if tag in tags:
                     date_str = tags[tag]
                     # Try to parse ISO format
@@ -84,15 +124,90 @@ def get_video_date_ffprobe(filepath: str | Path) -> Optional[datetime]:
     return None
 
 
-def get_file_dates(filepath: str | Path) -> Tuple[datetime, datetime]:
+def _find_box(fd: int, box_type: bytes, start: int, end: int) -> Optional[Tuple[int, int]]:
+    """
+    Find a box among the siblings in [start, end) of an ISO BMFF file.
+
+    Only box headers are read. Returns (payload_start, box_end), or None.
+    """
+    pos = start
+    while pos + 8 <= end:
+        header = _pread(fd, 16, pos)
+        if len(header) < 8:
+            return None
+        size, typ = struct.unpack_from('>I4s', header)
+        header_size = 8
+        if size == 1:
+            # 64-bit size follows the type
+            if len(header) < 16:
+                return None
+            (size,) = struct.unpack_from('>Q', header, 8)
+            header_size = 16
+        elif size == 0:
+            # Box extends to the end of its parent
+            size = end - pos
+        if size < header_size:
+            return None
+        if typ == box_type:
+            return pos + header_size, min(pos + size, end)
+        pos += size
+    return None
+
+
+def get_video_date_mp4(filepath: str | Path) -> Optional[datetime]:
+    """
+    Extract creation date from the movie header (moov/mvhd) of an MP4/MOV file.
+
+    This is the value ffprobe reports as creation_time, read without
+    starting a process; only box headers and the start of mvhd are read.
+    """
+    try:
+        fd = os.open(filepath, HEADER_OPEN_FLAGS)
+        try:
+            end = os.fstat(fd).st_size
+            moov = _find_box(fd, b'moov', 0, end)
+            mvhd = moov and _find_box(fd, b'mvhd', *moov)
+            if not mvhd:
+                return None
+
+            data = _pread(fd, 12, mvhd[0])
+            # Version 1 headers use 64-bit times
+            if data[0] == 1:
+                (timestamp,) = struct.unpack_from('>Q', data, 4)
+            else:
+                (timestamp,) = struct.unpack_from('>I', data, 4)
+        finally:
+            os.close(fd)
+
+        if not timestamp:
+            return None
+        # Like ffprobe, treat times before the Unix epoch as already Unix time
+        if timestamp >= QUICKTIME_EPOCH_OFFSET:
+            timestamp -= QUICKTIME_EPOCH_OFFSET
+        return datetime(1970, 1, 1) + timedelta(seconds=timestamp)
+
+    except (OSError, IndexError, struct.error, OverflowError) as e:
+        logger.debug(f"Could not read movie header of {filepath}: {e}")
+
+    return None
+
+
+def get_file_dates(
+    filepath: str | Path,
+    stat: Optional[os.stat_result] = None,
+) -> Tuple[datetime, datetime]:
     """
     Get file creation and modification dates from filesystem.
 
+    Args:
+        filepath: File to read dates for
+        stat: Result of os.stat(filepath) if the caller already has it
+
     Returns:
         Tuple of (creation_date, modification_date)
     """
-    filepath = Path(filepath)
-    stat = filepath.stat()
+    if stat is None:
+        stat = os.stat(filepath)
 
     # On macOS/Windows, st_birthtime is the creation time
     # On Linux, st_ctime is the metadata change time (not creation)
@@ -111,8 +226,9 @@ def get_video_date(filepath: str | Path) -> Optional[datetime]:
     """
     Extract the original creation date from video metadata.
 
-    Tries ffprobe first, returns None if no metadata date found.
-    File dates are handled separately as fallback.
+    Reads the movie header directly for MP4/MOV files, then tries ffprobe;
+    returns None if no metadata date found. File dates are handled
+    separately as fallback.
     """
     filepath = Path(filepath)
 
@@ -120,10 +236,27 @@ def get_video_date(filepath: str | Path) -> Optional[datetime]:
         logger.warning(f"File not found: {filepath}")
         return None
 
-    if not is_supported_video(filepath):
+    return read_video_date(filepath)
+
+
+def read_video_date(filepath: str | Path) -> Optional[datetime]:
+    """
+    Extract the video metadata date from a file already known to exist.
+
+    Same as get_video_date() without the existence check, for callers that
+    have just stat'ed the file.
+    """
+    # The extension is parsed once, for both the support check and dispatch
+    ext = os.path.splitext(filepath)[1].lower()
+    if ext not in SUPPORTED_VIDEO_EXTENSIONS:
         logger.debug(f"Unsupported file type: {filepath}")
         return None
 
+    if ext in ISO_BMFF_EXTENSIONS:
+        date = get_video_date_mp4(filepath)
+        if date:
+            return date
+
     # Try ffprobe
     date = get_video_date_ffprobe(filepath)
     if date:
@@ -145,12 +278,13 @@ def get_video_metadata(filepath: str | Path) -> dict:
         - extension: str
     """
     filepath = Path(filepath)
-    creation_date, modification_date = get_file_dates(filepath)
+    stat = filepath.stat()
+    creation_date, modification_date = get_file_dates(filepath, stat)
 
     return {
-        'metadata_date': get_video_date(filepath),
+        'metadata_date': read_video_date(filepath),
         'creation_date': creation_date,
         'modification_date': modification_date,
-        'file_size': filepath.stat().st_size,
+        'file_size': stat.st_size,
         'extension': filepath.suffix.lower(),
     }
@@ -4,67 +4,102 @@ Video scanner module - discovers and catalogs videos from directories.
 Uses parallel processing for fast scanning of large video collections.
 """
 
-import hashlib
 import logging
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
 from datetime import datetime
 from pathlib import Path
-from typing import Generator, Optional, Callable, List
+from typing import Generator, Iterator, Optional, Callable, List, Tuple
 import multiprocessing
 
+from .scanner import calculate_checksum
 from .video_database import VideoDatabase
 from .video_reader import (
-    get_video_date, get_file_dates, is_supported_video, SUPPORTED_VIDEO_EXTENSIONS
+    get_file_dates, is_supported_video, read_video_date, SUPPORTED_VIDEO_EXTENSIONS
 )
 from .video_models import VideoBatch, VideoBatchStatus, VideoFile, VideoFileStatus
 
 logger = logging.getLogger(__name__)
 
-# Chunk size for calculating MD5 checksum
-CHECKSUM_CHUNK_SIZE = 65536  # 64KB
-
 # Batch size for bulk inserts
 BULK_INSERT_SIZE = 500
 
 # Default number of worker threads
 DEFAULT_WORKERS = min(32, (multiprocessing.cpu_count() or 1) * 4)
 
+# Default number of worker processes (one per CPU core)
+DEFAULT_PROCESS_WORKERS = multiprocessing.cpu_count() or 1
+
+# Default number of checksum workers; hashing is CPU-bound, unlike metadata reads
+DEFAULT_CHECKSUM_WORKERS = multiprocessing.cpu_count() or 1
 
-def calculate_checksum(filepath: Path) -> str:
-    """Calculate MD5 checksum of a file."""
-    md5 = hashlib.md5()
-    with open(filepath, 'rb') as f:
-        for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b''):
-            md5.update(chunk)
-    return md5.hexdigest()
+# Threads listing directories during discovery
+DISCOVERY_WORKERS = 8
 
+# Files queued per scan worker, bounds memory use on large trees
+SCAN_QUEUE_FACTOR = 4
 
-def discover_videos_fast(directory: Path) -> List[Path]:
+
+def _list_directory(directory: str) -> Tuple[List[str], List[str]]:
     """
-    Recursively discover all video files in a directory.
+    List one directory for discover_videos_fast.
 
-    Returns a list for parallel processing.
+    Returns (video paths, subdirectory paths) as strings, skipping hidden
+    entries and symlinked directories like os.walk does.
     """
     videos = []
-    for root, dirs, files in os.walk(directory):
-        # Skip hidden directories
-        dirs[:] = [d for d in dirs if not d.startswith('.')]
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
 
-        for filename in files:
-            # Skip hidden files
-            if filename.startswith('.'):
-                continue
+                # Skip hidden files and directories
+                if name.startswith('.'):
+                    continue
 
-            filepath = Path(root) / filename
-            if is_supported_video(filepath):
-                videos.append(filepath)
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif is_supported_video(name):
+                    videos.append(entry.path)
+    except OSError as e:
+        logger.debug(f"Cannot list {directory}: {e}")
+
+    return videos, subdirs
+
+
+def discover_videos_fast(directory: str | Path) -> List[str]:
+    """
+    Recursively discover all video files in a directory.
+
+    Directories are listed with os.scandir, one tree level at a time, on a
+    small thread pool so slow (network or cold) listings overlap. Returns
+    path strings, shallower directories first, for parallel processing.
+    """
+    videos = []
+    level = [str(directory)]
+
+    with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as executor:
+        while level:
+            next_level = []
+            for files, subdirs in executor.map(_list_directory, level):
+                videos.extend(files)
+                next_level.extend(subdirs)
+            level = next_level
 
     return videos
 
 
 def process_single_video(
-    filepath: Path,
+    filepath: str | Path,
     batch_id: int,
     calculate_checksums: bool
 ) -> Optional[VideoFile]:
@@ -74,25 +109,26 @@ def process_single_video(
     This function is designed to be called in parallel.
     """
     try:
-        creation_date, modification_date = get_file_dates(filepath)
-        metadata_date = get_video_date(filepath)
+        # One stat serves the dates and size and confirms the file exists
+        path = str(filepath)
+        stat = os.stat(path)
+        creation_date, modification_date = get_file_dates(path, stat)
+        metadata_date = read_video_date(path)
 
         checksum = None
         if calculate_checksums:
             try:
-                checksum = calculate_checksum(filepath)
+                checksum = calculate_checksum(path)
             except Exception as e:
                 logger.debug(f"Failed to calculate checksum for {filepath}: {e}")
 
-        stat = filepath.stat()
-
         return VideoFile(
             id=None,
             batch_id=batch_id,
-            source_path=str(filepath),
-            filename=filepath.name,
+            source_path=path,
+            filename=os.path.basename(path),
             file_size=stat.st_size,
-            file_extension=filepath.suffix.lower(),
+            file_extension=os.path.splitext(path)[1].lower(),
             metadata_date=metadata_date,
             file_creation_date=creation_date,
             file_modification_date=modification_date,
@@ -117,6 +153,8 @@ class VideoScanner:
         calculate_checksums: bool = False,  # Default off for videos (large files)
         progress_callback: Optional[Callable[[int, int, str], None]] = None,
         num_workers: Optional[int] = None,
+        use_processes: bool = False,
+        checksum_workers: Optional[int] = None,
     ):
         """
         Initialize the scanner.
@@ -126,11 +164,20 @@ class VideoScanner:
             calculate_checksums: Whether to calculate MD5 checksums (slow for videos)
             progress_callback: Optional callback(scanned, total, current_file)
             num_workers: Number of parallel workers (default: auto)
+            use_processes: Process files in worker processes instead of
+                threads, so checksum work is not limited by the GIL
+            checksum_workers: Number of parallel checksum workers (default:
+                one per CPU core); checksums are computed after the metadata
+                pass, see compute_checksums
         """
         self.db = db
         self.calculate_checksums = calculate_checksums
         self.progress_callback = progress_callback
-        self.num_workers = num_workers or DEFAULT_WORKERS
+        self.use_processes = use_processes
+        self.num_workers = num_workers or (
+            DEFAULT_PROCESS_WORKERS if use_processes else DEFAULT_WORKERS
+        )
+        self.checksum_workers = checksum_workers or DEFAULT_CHECKSUM_WORKERS
 
     def scan(
         self,
@@ -189,10 +236,8 @@ class VideoScanner:
         )
 
         # Filter out already processed files
-        files_to_process = []
-        for filepath in all_videos:
-            if not self.db.file_exists(str(filepath)):
-                files_to_process.append(filepath)
+        existing = self.db.existing_source_paths(all_videos)
+        files_to_process = [p for p in all_videos if p not in existing]
 
         skipped = total_files - len(files_to_process)
         if skipped > 0:
@@ -205,51 +250,42 @@ class VideoScanner:
         video_buffer = []
 
         try:
-            with ThreadPoolExecutor(max_workers=self.num_workers) as executor:
-                # Submit all tasks
-                future_to_path = {
-                    executor.submit(
-                        process_single_video,
-                        filepath,
-                        batch.id,
-                        self.calculate_checksums
-                    ): filepath
-                    for filepath in files_to_process
-                }
-
-                # Process results as they complete
-                for future in as_completed(future_to_path):
-                    filepath = future_to_path[future]
-                    scanned += 1
-
-                    try:
-                        video = future.result()
-                        if video:
-                            video_buffer.append(video)
-
-                            # Bulk insert when buffer is full
-                            if len(video_buffer) >= BULK_INSERT_SIZE:
-                                self.db.add_video_files_bulk(video_buffer)
-                                video_buffer.clear()
-
-                    except Exception as e:
-                        logger.warning(f"Error processing {filepath}: {e}")
-
-                    # Update progress
-                    if self.progress_callback:
-                        self.progress_callback(scanned, total_files, str(filepath))
-
-                    # Update batch progress periodically
-                    if scanned % 100 == 0:
-                        self.db.update_batch_status(
-                            batch.id, VideoBatchStatus.SCANNING,
-                            scanned_files=scanned,
-                            last_processed_path=str(filepath)
-                        )
+            # Process results as they complete
+            for filepath, future in self._process_files(files_to_process, batch.id):
+                scanned += 1
+
+                try:
+                    video = future.result()
+                    if video:
+                        video_buffer.append(video)
+
+                        # Bulk insert when buffer is full
+                        if len(video_buffer) >= BULK_INSERT_SIZE:
+                            self.db.add_video_files_bulk(video_buffer)
+                            video_buffer.clear()
+
+                except Exception as e:
+                    logger.warning(f"Error processing {filepath}: {e}")
+
+                # Update progress
+                if self.progress_callback:
+                    self.progress_callback(scanned, total_files, str(filepath))
+
+                # Update batch progress periodically
+                if scanned % 100 == 0:
+                    self.db.update_batch_status(
+                        batch.id, VideoBatchStatus.SCANNING,
+                        scanned_files=scanned,
+                        last_processed_path=str(filepath)
+                    )
 
             # Insert remaining videos
             if video_buffer:
                 self.db.add_video_files_bulk(video_buffer)
+                video_buffer.clear()
+
+            if self.calculate_checksums:
+                self.compute_checksums(batch.id)
 
             # Mark scan as complete
             self.db.update_batch_counts(batch.id)
@@ -280,3 +316,95 @@ class VideoScanner:
             raise
 
         return self.db.get_batch(batch.id)
+
+    def _process_files(
+        self,
+        filepaths: List[str],
+        batch_id: int,
+    ) -> Iterator[Tuple[str, Future]]:
+        """
+        Run process_single_video over filepaths, yielding (path, future)
+        pairs as files finish.
+
+        At most num_workers * SCAN_QUEUE_FACTOR files are queued at any time.
+        Checksums are left to compute_checksums.
+        """
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        max_queued = self.num_workers * SCAN_QUEUE_FACTOR
+        executor = executor_class(max_workers=self.num_workers)
+        try:
+            in_flight = {}
+            for filepath in filepaths:
+                future = executor.submit(process_single_video, filepath, batch_id, False)
+                in_flight[future] = filepath
+
+                if len(in_flight) >= max_queued:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield in_flight.pop(future), future
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield in_flight.pop(future), future
+        finally:
+            # Don't start queued files after an interrupt or error
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def compute_checksums(self, batch_id: int) -> int:
+        """
+        Checksum the files in a batch that have no checksum yet.
+
+        Runs after the metadata pass on its own pool, sized for CPU-bound
+        hashing rather than for metadata reads.
+
+        Returns:
+            Number of files hashed
+        """
+        candidates = self.db.get_unhashed_files(batch_id)
+        if not candidates:
+            return 0
+
+        logger.info(
+            f"Calculating checksums for {len(candidates)} files "
+            f"with {self.checksum_workers} workers..."
+        )
+
+        executor_class = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        max_queued = self.checksum_workers * SCAN_QUEUE_FACTOR
+        updates = []
+        hashed = 0
+        executor = executor_class(max_workers=self.checksum_workers)
+        try:
+            in_flight = {}
+            pending = iter(candidates)
+            while True:
+                # Keep at most max_queued files submitted
+                for file_id, source_path in pending:
+                    future = executor.submit(calculate_checksum, source_path)
+                    in_flight[future] = (file_id, source_path)
+                    if len(in_flight) >= max_queued:
+                        break
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_id, source_path = in_flight.pop(future)
+                    try:
+                        updates.append((file_id, future.result()))
+                    except Exception as e:
+                        logger.debug(f"Failed to calculate checksum for {source_path}: {e}")
+
+                if len(updates) >= BULK_INSERT_SIZE:
+                    self.db.update_checksums_bulk(updates)
+                    hashed += len(updates)
+                    updates.clear()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+        if updates:
+            self.db.update_checksums_bulk(updates)
+            hashed += len(updates)
+
+        return hashed